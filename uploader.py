@@ -15,40 +15,279 @@ Date: Juli 2025
 import os
 import sys
 import re
+import random
+import stat
 import time
-import traceback
-from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+import shutil
+import unicodedata
+import calendar
+from typing import List, Dict, Iterator, Optional, Tuple, TypedDict
 import argparse
 import json
+import queue
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
 
-# Google API imports
-import googleapiclient.discovery
+# Google API imports (der restliche Google-Client-Stack wird erst bei Bedarf geladen,
+# damit --help und --preview ohne Authentifizierung schnell starten)
 import googleapiclient.errors
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.http import MediaFileUpload
 
 # Utility imports
 from dotenv import load_dotenv
-from colorama import init, Fore, Back, Style
+from colorama import init, Fore, Style
 from tqdm import tqdm
-import click
 
 # Initialize colorama for colored terminal output
 init(autoreset=True)
 
+
+@lru_cache(maxsize=None)
+def _get_youtube_module():
+    """Importiert googleapiclient.discovery beim ersten Aufruf (teurer Import)"""
+    import googleapiclient.discovery
+    return googleapiclient.discovery
+
+
+@lru_cache(maxsize=None)
+def _get_youtube_discovery_document() -> Optional[str]:
+    """Liest das mitgelieferte Discovery-Dokument der YouTube API einmalig (None falls nicht vorhanden)"""
+    from googleapiclient.discovery_cache import get_static_doc
+    return get_static_doc('youtube', 'v3')
+
+
+class PlaylistInfo(TypedDict):
+    """Playlist-Zuordnung eines Videos (siehe _determine_playlists)"""
+    main_folder: Optional[str]
+    game_folder: Optional[str]
+    sub_folders: Tuple[str, ...]
+    all_folders: Tuple[str, ...]
+    potential_playlists: Tuple[str, ...]
+    primary_playlist: Optional[str]
+    additional_playlists: Tuple[str, ...]
+
+
+class _VideoInfoRequired(TypedDict):
+    file_path: str
+    filename: str
+    title: str
+    video_type: str
+    folder_structure: List[str]
+    playlist_info: PlaylistInfo
+    record_mtime: float  # Aufnahmezeitpunkt (Unix-Zeit)
+    record_date_str: str  # record_mtime im Anzeigeformat (RECORD_DATE_FORMAT)
+    file_size: int  # Bytes (MB-Angaben werden nur bei der Ausgabe berechnet)
+
+
+class VideoInfo(_VideoInfoRequired, total=False):
+    """Metadaten eines gefundenen Videos (von den _analyze_*-Methoden erzeugt)"""
+    from_upload_folder: bool
+
+
+class _ProgressReader:
+    """Datei-Wrapper, der gelesene Bytes an eine Progress Bar meldet (unabhängig von der Chunk-Größe)"""
+    
+    __slots__ = ('_file', '_on_progress', '_reported')
+    
+    # Fortschritt gesammelt melden statt pro 8-KB-Block (den Rest füllt der Upload-Abschluss auf)
+    REPORT_INTERVAL = 1024 * 1024
+    
+    def __init__(self, file, on_progress):
+        self._file = file
+        self._on_progress = on_progress
+        self._reported = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        position = self._file.tell()
+        if position - self._reported >= self.REPORT_INTERVAL:
+            self._on_progress(position - self._reported)
+            self._reported = position
+        return data
+    
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        position = self._file.seek(offset, whence)
+        # Wiederholung ab dem letzten bestätigten Stand: Balken zurücksetzen statt doppelt zu zählen
+        if position < self._reported:
+            self._on_progress(position - self._reported)
+            self._reported = position
+        return position
+    
+    def tell(self) -> int:
+        return self._file.tell()
+
+
+class _SharedProgress:
+    """Gemeinsamer Fortschrittsbalken paralleler Uploads (Updates aus mehreren Threads)"""
+    
+    __slots__ = ('_bar', '_lock')
+    
+    def __init__(self, bar):
+        self._bar = bar
+        self._lock = threading.Lock()
+    
+    def update(self, n: int):
+        with self._lock:
+            self._bar.update(n)
+    
+    def discard(self, done: int, size: int):
+        """Nimmt eine nicht abgeschlossene Datei wieder aus Gesamtgröße und Fortschritt heraus"""
+        with self._lock:
+            self._bar.total -= size
+            self._bar.update(-done)
+    
+    def close(self):
+        with self._lock:
+            self._bar.close()
+
+
+class _SharedProgressView:
+    """Anteil einer Datei am gemeinsamen Balken (bietet die in _upload_single_video genutzten tqdm-Methoden)"""
+    
+    __slots__ = ('_shared', 'n')
+    
+    def __init__(self, shared: _SharedProgress):
+        self._shared = shared
+        self.n = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def update(self, n: int):
+        self.n += n
+        self._shared.update(n)
+    
+    @staticmethod
+    def write(text: str):
+        tqdm.write(text)
+    
+    def refresh(self):
+        pass
+
+
+class _RateLimiter:
+    """Token-Bucket für API-Aufrufe (thread-sicher, Wartezeit wird vorab reserviert)"""
+    
+    __slots__ = ('_rate', '_burst', '_tokens', '_last', '_lock')
+    
+    def __init__(self, rate: float, burst: float):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: int = 1):
+        """Wartet, bis genügend Tokens für die angegebene Anzahl an Requests verfügbar sind"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            # Tokens sofort abziehen (ggf. ins Minus), damit parallele Aufrufer nacheinander drankommen
+            self._tokens -= tokens
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _DaemonThreadPool(Executor):
+    """Thread-Pool mit Daemon-Threads: laufende Requests blockieren das Programmende nach Strg+C nicht"""
+    
+    def __init__(self, max_workers: int):
+        self._queue = queue.SimpleQueue()
+        self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(max_workers)]
+        for thread in self._threads:
+            thread.start()
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+    
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            # Bereits abgebrochene Aufträge überspringen
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+    
+    def shutdown(self, wait: bool = True, **kwargs):
+        for _ in self._threads:
+            self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
 class YouTubeUploader:
     """Hauptklasse für den YouTube Gaming Video Uploader"""
     
+    # Feste Instanz-Attribute (kein __dict__ pro Instanz)
+    __slots__ = (
+        'debug_mode', 'recordings_path', 'default_visibility', 'max_concurrent_uploads', 'youtube_service',
+        'playlist_cache', 'playlist_cache_loaded', '_playlist_cache_meta', '_dir_listing_cache', '_title_cache', 'stats',
+        '_credentials', '_thread_local', '_playlist_lock', '_pacing_lock', '_next_upload_start',
+        '_upload_delay', '_upload_chunk_override', '_rate_limiter', '_resume_state', '_resume_lock', '_abort_uploads',
+        '_quota_limit', '_quota_state', '_quota_lock', '_reserved_playlists', '_repair_missing_umlauts'
+    )
+    
     # Unterstützte Video- und Audio-Formate
-    SUPPORTED_FORMATS = ['.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.aac', '.mp3', '.wav', '.m4a']
+    SUPPORTED_FORMATS = frozenset(['.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.aac', '.mp3', '.wav', '.m4a'])
+    # Gleiche Endungen als Tupel für str.endswith (kein Suffix-String pro Datei)
+    SUPPORTED_FORMATS_TUPLE = tuple(SUPPORTED_FORMATS)
     
     # Video-Präfixe
-    VIDEO_PREFIXES = ['merged_', 'unmergable_', 'onlymic_', 'onlydesktop_']
+    VIDEO_PREFIXES = ('merged_', 'unmergable_', 'onlymic_', 'onlydesktop_')
     UPLOADED_PREFIX = 'uploaded_'
+    # Liefert Video-Typ (Gruppe 1) und Präfix-Länge (match.end()) in einem Schritt
+    _VIDEO_PREFIX_RE = re.compile(r'(merged|unmergable|onlymic|onlydesktop)_')
+    
+    # Typabhängige Texte und Statistik-Schlüssel (unbekannte Typen werden wie 'unmergable' behandelt)
+    _STATS_KEY_BY_TYPE = {
+        'merged': 'merged_videos',
+        'onlymic': 'onlymic_videos',
+        'onlydesktop': 'onlydesktop_videos',
+        'unmergable': 'unmergable_videos',
+    }
+    _DESCRIPTION_INTRO_BY_TYPE = {
+        'onlymic': ('Mikrofon Audio: ', 'Nur Mikrofon-Aufnahme ohne Desktop-Audio'),
+        'onlydesktop': ('Game/Desktop Audio: ', 'Nur Game-/Desktop-Audio ohne Mikrofon'),
+    }
+    _DEFAULT_DESCRIPTION_INTRO = ('Gameplay Video: ',)
+    _STATUS_BY_TYPE = {
+        'merged': 'Status: Sound erfolgreich gemerged',
+        'onlymic': 'Status: Nur Mikrofon-Audio extrahiert',
+        'onlydesktop': 'Status: Nur Game/Desktop-Audio extrahiert',
+        'unmergable': 'Status: Sound war nicht mergbar (Original-Audio)',
+    }
+    _TAGS_BY_TYPE = {
+        'onlymic': ('Audio', 'Mikrofon', 'Mic Only', 'Voice', 'Deutsch'),
+        'onlydesktop': ('Audio', 'Game Audio', 'Desktop Audio', 'Sound Effects', 'Gaming'),
+    }
+    _DEFAULT_TAGS = ('Gaming', 'Gameplay', 'Deutsch', "Let's Play")
+    
+    # Feste Teile der Insert-Requests (Videos und Playlists), nur privacyStatus hängt von der Konfiguration ab
+    _INSERT_PART = 'snippet,status'
+    _VIDEO_STATUS = {
+        'selfDeclaredMadeForKids': False,  # Explizit NICHT für Kinder
+        'embeddable': True,
+        'license': 'youtube',
+        'publicStatsViewable': True
+    }
+    
+    # Anzeigeformat des Aufnahmedatums (Vorschau und Beschreibung)
+    RECORD_DATE_FORMAT = '%d.%m.%Y - %H:%M Uhr'
     
     # Haupt-Ordner
     MAIN_FOLDERS = ['SPIEL AUFNAHMEN', 'WITZIGE MOMENTE', 'GESCHNITTE MOMENTE']
@@ -59,24 +298,223 @@ class YouTubeUploader:
         'https://www.googleapis.com/auth/youtube'
     ]
     
-    def __init__(self, recordings_path: Optional[str] = None, debug_mode: bool = False):
+    # Socket-Timeout (Sekunden) für die wiederverwendete HTTP-Verbindung
+    HTTP_TIMEOUT = 60
+    
+    # Parallele Uploads (YouTube erlaubt mehrere resumable Uploads gleichzeitig), Standardwert
+    MAX_PARALLEL_UPLOADS = 3
+    
+    # Adaptiver Abstand zwischen Upload-Starts (AIMD): sinkt bei Erfolg schrittweise,
+    # verdoppelt sich bei Drosselung durch die API (429, 5xx, quotaExceeded)
+    UPLOAD_DELAY_INITIAL = 0.5  # Sekunden
+    UPLOAD_DELAY_STEP = 0.5
+    UPLOAD_DELAY_MAX = 60
+    UPLOAD_RETRY_STATUS = (429, 500, 502, 503, 504)
+    
+    # Wiederholungen bei temporären Fehlern: Decorrelated Jitter zwischen Basis und dreifacher letzter Wartezeit,
+    # damit parallele Uploads nicht im Gleichtakt erneut anfragen (ein Retry-After der API hat Vorrang)
+    UPLOAD_MAX_RETRIES = 5
+    RETRY_BASE_DELAY = 1.0  # Sekunden
+    RETRY_MAX_DELAY = 60.0
+    
+    # Fehlergründe der API (error.errors[].reason) → Behandlung beim Upload
+    UPLOAD_ERROR_ACTIONS = {
+        'quotaExceeded': 'quota',
+        'dailyLimitExceeded': 'quota',
+        'rateLimitExceeded': 'retry',
+        'userRateLimitExceeded': 'retry',
+        'backendError': 'retry',
+    }
+    
+    # Upload-Chunks: immer begrenzt (Fortsetzen/Anhalten pro Chunk), große Dateien in wenigen großen Chunks
+    # (Chunk-Größen müssen Vielfache von 256 KB sein)
+    UPLOAD_CHUNK_MIN = 8 * 1024 * 1024
+    UPLOAD_CHUNK_MAX = 256 * 1024 * 1024
+    UPLOAD_CHUNK_ALIGN = 256 * 1024
+    
+    # Playlist-Zuordnung per Batch-Request (max. 50 Teil-Requests pro Batch laut API)
+    PLAYLIST_BATCH_SIZE = 50
+    PLAYLIST_BATCH_RETRIES = 5
+    PLAYLIST_RETRY_STATUS = (409, 429, 500, 502, 503, 504)
+    
+    # OAuth-Token im Benutzer-Konfigurationsordner (früher token.json im Arbeitsverzeichnis)
+    CONFIG_DIR = os.path.join(os.getenv('XDG_CONFIG_HOME') or os.path.expanduser('~/.config'), 'youtube-uploader')
+    TOKEN_FILE = os.path.join(CONFIG_DIR, 'token.json')
+    LEGACY_TOKEN_FILE = 'token.json'
+    CREDENTIALS_FILE = 'credentials.json'  # OAuth2-Client aus der Google Cloud Console (Arbeitsverzeichnis)
+    
+    # Lokaler Playlist-Cache neben dem Token: innerhalb der TTL ohne API-Aufruf verwendet,
+    # danach per ETag revalidiert (früher .playlist_cache.json im Arbeitsverzeichnis)
+    PLAYLIST_CACHE_FILE = os.path.join(CONFIG_DIR, 'playlist_cache.json')
+    LEGACY_PLAYLIST_CACHE_FILE = '.playlist_cache.json'
+    PLAYLIST_CACHE_TTL = 24 * 60 * 60  # Sekunden
+    
+    # Offene Upload-Sessions (URI + bestätigte Bytes), damit abgebrochene Uploads fortgesetzt werden
+    RESUME_FILE = os.path.join(CONFIG_DIR, 'resume.json')
+    
+    # Lokaler Quota-Zähler (Kosten laut API-Dokumentation), damit Uploads vor dem Überschreiten
+    # des Tagesbudgets zurückgestellt werden statt mit quotaExceeded zu scheitern
+    QUOTA_FILE = os.path.join(CONFIG_DIR, 'quota.json')
+    # Tagesbudget per DAILY_QUOTA (z.B. 10000); standardmäßig aus, da die tatsächlichen Upload-Kosten
+    # erfahrungsgemäß deutlich unter den dokumentierten 1600 Punkten liegen (siehe README)
+    DAILY_QUOTA = 0
+    QUOTA_COSTS = {'upload': 1600, 'playlist_insert': 50, 'playlist_item': 50, 'list': 1}
+    QUOTA_TIMEZONE = 'America/Los_Angeles'  # Zurücksetzung um Mitternacht pazifischer Zeit
+    
+    # Vorkompilierte Patterns für _fix_encoding_issues (einmalig beim Laden der Klasse)
+    # Schnelltest für reine ASCII-Titel: Nur diese Zeichen/Muster können dort überhaupt etwas ändern
+    # (Fragezeichen, Escape-Sequenzen, Steuerzeichen; Konsonanten-Cluster nur mit aktiviertem Schritt 3c)
+    _ASCII_REPAIR_RE = re.compile(r'[?\\\x00-\x08\x0B\x0C\x0E-\x1F]')
+    # 1: Vorfilter für die Latin-1→UTF-8-Reparatur
+    _LATIN1_HIGH_RE = re.compile('[\x80-\xff]')
+    # 3a: Defektes Zeichen zwischen zwei Großbuchstaben-Konsonanten
+    _CONSONANT_GAP_RE = re.compile(r'([BCDFGHJKLMNPQRSTVWXYZ])[�?]([BCDFGHJKLMNPQRSTVWXYZ])')
+    
+    # 3b: Bekannte deutsche Vokal-Kombinationen
+    _UMLAUT_PATTERNS = [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in [
+        # Ä Reparatur - häufige deutsche Buchstabenkombinationen
+        (r'([BCDFGKLMNPRSTVWXZ])[�?]([NRTCHDGLMS])', r'\1Ä\2'),  # z.B. ÄNGT, ÄRT, ÄCK
+        (r'([BCDFGHJKLMNPQRSTVWXYZ])[�?]([BCDFGHJKLMNPQRSTVWXYZ][EI])', r'\1Ä\2'),  # vor -E, -ER, -EN, -EL
+        (r'H[�?]([NRTL])', r'HÄ\1'),  # HÄNGT, HÄRT, HÄTTE
+        
+        # Ö Reparatur - typische deutsche Ö-Kombinationen
+        (r'([BCDFGKLMNPRSTVWXZ])[�?]([NRTL])', r'\1Ö\2'),  # z.B. HÖHRT, KÖNIG, GRÖSSER
+        (r'H[�?][RT]', 'HÖR'),  # HÖRT ist sehr häufig
+        
+        # Ü Reparatur - typische deutsche Ü-Kombinationen
+        (r'([BCDFGKLMNPRSTVWXZ])[�?]([CKHLNRT])', r'\1Ü\2'),  # z.B. GLÜCK, MÜHLE, DRÜCK
+        (r'GL[�?]CK', 'GLÜCK'),  # GLÜCK ist sehr häufig
+        (r'([DFGLMNRSTW])[�?]([HLNRSTCK])', r'\1Ü\2'),  # Breite Abdeckung für Ü
+    ]]
+    
+    # 3a + 3b kombiniert: Eine Alternative pro Regel (gleiche Priorität wie oben), jede beginnt am Zeichen
+    # vor dem defekten Zeichen. So wird jedes defekte Zeichen in einem einzigen Durchlauf repariert.
+    _UMLAUT_CONTEXT_RULES = [
+        (r'(?-i:[BCDFGHJKLMNPQRSTVWXYZ][�?][BCDFGHJKLMNPQRSTVWXYZ])', None),  # 3a: Kontext raten
+        (r'[BCDFGKLMNPRSTVWXZ][�?](?=[NRTCHDGLMS])', lambda s: s[0] + 'Ä'),
+        (r'[BCDFGHJKLMNPQRSTVWXYZ][�?](?=[BCDFGHJKLMNPQRSTVWXYZ][EI])', lambda s: s[0] + 'Ä'),
+        (r'H[�?](?=[NRTL])', lambda s: 'HÄ'),
+        (r'[BCDFGKLMNPRSTVWXZ][�?](?=[NRTL])', lambda s: s[0] + 'Ö'),
+        (r'H[�?][RT]', lambda s: 'HÖR'),
+        (r'[BCDFGKLMNPRSTVWXZ][�?](?=[CKHLNRT])', lambda s: s[0] + 'Ü'),
+        (r'(?<=G)L[�?]CK', lambda s: 'LÜCK'),
+        (r'[DFGLMNRSTW][�?](?=[HLNRSTCK])', lambda s: s[0] + 'Ü'),
+    ]
+    _UMLAUT_CONTEXT_RE = re.compile(
+        '|'.join(f'(?P<u{i}>{pattern})' for i, (pattern, _) in enumerate(_UMLAUT_CONTEXT_RULES)), re.IGNORECASE)
+    # Liegen defekte Zeichen höchstens 4 Zeichen auseinander, überschneiden sich ihre Kontexte -
+    # dann schrittweise Reparatur mit den Einzel-Patterns (identisches Ergebnis zur sequentiellen Anwendung)
+    _CLOSE_DEFECTS_RE = re.compile(r'[�?].{0,3}[�?]', re.DOTALL)
+    
+    # 3c: Fehlende Umlaute auf Wort-Ebene (nur mit REPAIR_MISSING_UMLAUTS=true, rät auch bei Abkürzungen)
+    _MISSING_UMLAUT_HINT_RE = re.compile(r'\b[BCDFGHJKLMNPQRSTVWXYZ]{2}')
+    _WORD_PATTERNS = [(re.compile(pattern), replacement) for pattern, replacement in [
+        # Ä-Ergänzung
+        (r'\b([BCDFGHJKLMNPQRSTVWXYZ]+)NGT\b', r'\1ÄNGT'),  # -ÄNGT Endung
+        (r'\b([BCDFGHJKLMNPQRSTVWXYZ])RT\b', r'\1ÄRT'),      # -ÄRT Endung
+        (r'\bH([LNRT]+)\b', r'HÄ\1'),                        # H + Konsonant = HÄ
+        
+        # Ö-Ergänzung
+        (r'\bH([RT]+)\b', r'HÖ\1'),                          # HRT = HÖRT
+        (r'\b([BCDFGKLMNPRSTVWXZ]+)([LNRT]+)([^AEIOU])\b',
+         lambda m: f"{m.group(1)}Ö{m.group(2)}{m.group(3)}" if len(m.group(2)) <= 2 else m.group(0)),
+        
+        # Ü-Ergänzung - sehr häufige deutsche Muster
+        (r'\bGL([CK]+)\b', r'GLÜ\1'),                        # GLCK = GLÜCK
+        (r'\b([BCDFGKLMNPRSTVWXZ]+)CK\b',
+         lambda m: f"{m.group(1)}ÜCK" if len(m.group(1)) <= 3 else m.group(0)),  # -ÜCK Endung
+        (r'\b([DFGLMNRSTW])([HLNRSTCK]+)\b',
+         lambda m: f"{m.group(1)}Ü{m.group(2)}" if len(m.group(2)) <= 3 else m.group(0)),
+    ]]
+    
+    # 4: Unicode-Escape-Sequenzen (als Text) → Umlaut
+    _UNICODE_ESCAPES = {
+        '\\udcc4': 'Ä', '\\udce4': 'ä',
+        '\\udcd6': 'Ö', '\\udcf6': 'ö',
+        '\\udcdc': 'Ü', '\\udcfc': 'ü',
+        '\\udcdf': 'ß'
+    }
+    _UNICODE_ESCAPE_RE = re.compile('|'.join(map(re.escape, _UNICODE_ESCAPES)))
+    # Echte Surrogate aus Latin-1-Dateinamen (os.fsdecode mit surrogateescape) → Umlaut
+    _SURROGATE_TABLE = {int(escape[2:], 16): char for escape, char in _UNICODE_ESCAPES.items()}
+    
+    # 5/6: Finale Bereinigung
+    # Replacement- und Steuerzeichen (außer Tab/LF/CR, die als Leerraum normalisiert werden)
+    _STRIP_TABLE = str.maketrans('', '', '�' + ''.join(chr(c) for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)))
+    _FALLBACK_STRIP_TABLE = str.maketrans('', '', '�?')
+    
+    # Anzeige-Bereinigung (_clean_title_for_display) und Progress-Bar-Titel
+    _DISPLAY_STRIP_RE = re.compile(r'[^\x20-\x7E\u00C0-\u017F\u00C4\u00D6\u00DC\u00E4\u00F6\u00FC\u00DF]')
+    _ESCAPED_SURROGATE_RE = re.compile(r'\\udc[0-9a-fA-F]{2}')
+    # Progress-Bar-Titel: '?' und die nach _DISPLAY_STRIP_RE möglichen Nicht-ASCII-Zeichen entfernen
+    _PROGRESS_STRIP_TABLE = str.maketrans('', '', '?' + ''.join(map(chr, range(0xC0, 0x180))))
+    
+    def __init__(self, recordings_path: Optional[str] = None, debug_mode: bool = False,
+                 max_concurrent_uploads: Optional[int] = None,
+                 requests_per_second: Optional[float] = None, burst: Optional[int] = None):
         """Initialisierung des YouTube Uploaders"""
         self.debug_mode = debug_mode
         self.recordings_path = recordings_path or os.getenv('RECORDINGS_PATH')
         self.default_visibility = os.getenv('DEFAULT_VISIBILITY', 'unlisted').lower()
         
-        # YouTube API Service
+        # Feste Chunk-Größe für Uploads aus UPLOAD_CHUNK_MB (z.B. für langsame Leitungen)
+        self._upload_chunk_override = self._parse_upload_chunk_mb(os.getenv('UPLOAD_CHUNK_MB'))
+        
+        # Tagesbudget für den lokalen Quota-Zähler (Zählerstand wird erst bei Bedarf gelesen)
+        self._quota_limit = self._parse_daily_quota(os.getenv('DAILY_QUOTA'))
+        self._quota_state: Optional[Dict] = None
+        self._quota_lock = threading.Lock()
+        # Playlists, deren Erstellung bereits mit den Uploads reserviert ist (Schlüssel wie im Playlist-Cache)
+        self._reserved_playlists = set()
+        
+        # Fehlende Umlaute nur auf Wunsch ergänzen (Schritt 3c ändert sonst auch Kürzel wie 'GLCK' oder 'SCHN')
+        self._repair_missing_umlauts = os.getenv('REPAIR_MISSING_UMLAUTS', 'false').lower() == 'true'
+        
+        # Im Debug-Modus seriell hochladen, damit die Ausgaben nicht ineinanderlaufen
+        if debug_mode:
+            self.max_concurrent_uploads = 1
+        else:
+            self.max_concurrent_uploads = max(1, max_concurrent_uploads or self.MAX_PARALLEL_UPLOADS)
+        
+        # YouTube API Service (Haupt-Thread) und Credentials für die Services der Upload-Threads
         self.youtube_service = None
+        self._credentials = None
+        self._thread_local = threading.local()
+        
+        # Synchronisation für parallele Uploads
+        self._playlist_lock = threading.Lock()
+        self._pacing_lock = threading.Lock()
+        self._next_upload_start = 0.0
+        self._upload_delay = self.UPLOAD_DELAY_INITIAL
+        
+        # Fortsetzbare Uploads und Abbruch-Signal für die Upload-Threads
+        self._resume_state: Optional[Dict[str, Dict]] = None
+        self._resume_lock = threading.Lock()
+        self._abort_uploads = threading.Event()
+        
+        # Optionales Rate-Limit für API-Aufrufe (Requests pro Sekunde, None = unbegrenzt)
+        if requests_per_second:
+            self._rate_limiter = _RateLimiter(requests_per_second, burst or max(1, int(requests_per_second)))
+        else:
+            self._rate_limiter = None
         
         # Playlist-Cache zur Quota-Optimierung
         self.playlist_cache = {}
         self.playlist_cache_loaded = False
+        self._playlist_cache_meta: Optional[Dict] = None  # ETag und Abrufzeit der gespeicherten Liste
+        
+        # Verzeichnis-Listings während eines Scans (für die Suche nach Original-Dateien)
+        self._dir_listing_cache: Dict[str, frozenset] = {}
+        
+        # Bereinigte Anzeige-Titel (pro Video mehrfach benötigt)
+        self._title_cache: Dict[str, str] = {}
         
         # Statistiken
         self.stats = {
             'found_videos': 0,
             'uploaded_videos': 0,
             'failed_uploads': 0,
+            'deferred_uploads': 0,
             'merged_videos': 0,
             'unmergable_videos': 0,
             'onlymic_videos': 0,
@@ -85,22 +523,36 @@ class YouTubeUploader:
         
         self._print_header()
         
+    @staticmethod
+    def _print_lines(lines: List[str]):
+        """Gibt mehrere farbige Zeilen mit einem einzigen Schreibvorgang aus"""
+        # Farben je Zeile zurücksetzen (autoreset greift nur einmal pro write)
+        sys.stdout.write(''.join(f"{line}{Style.RESET_ALL}\n" for line in lines))
+        sys.stdout.flush()
+    
+    @classmethod
+    def _printable(cls, text: str) -> str:
+        """Macht Namen mit Surrogaten (Latin-1-Dateinamen per surrogateescape) für die Konsole ausgebbar"""
+        text = text.translate(cls._SURROGATE_TABLE)
+        return text.encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
+    
     def _print_header(self):
         """Druckt den Header mit Projektinformationen"""
-        print(f"\n{Fore.CYAN}{'='*70}")
-        print(f"{Fore.CYAN}🎮 YouTube Gaming Video Uploader v2.0 (Python + YouTube Data API)")
-        print(f"{Fore.CYAN}{'='*70}")
-        print(f"{Fore.YELLOW}📂 Aufnahmen-Pfad: {self.recordings_path}")
-        print(f"{Fore.YELLOW}👁️  Standard-Sichtbarkeit: {self.default_visibility.upper()}")
-        print(f"{Fore.YELLOW}🐛 Debug-Modus: {'AN' if self.debug_mode else 'AUS'}")
-        print(f"{Fore.CYAN}🔧 Quota-Optimierung: Aktiviert (Playlist-Caching)")
-        print(f"{Fore.CYAN}{'='*70}\n")
+        self._print_lines([
+            "",
+            f"{Fore.CYAN}{'='*70}",
+            f"{Fore.CYAN}🎮 YouTube Gaming Video Uploader v2.0 (Python + YouTube Data API)",
+            f"{Fore.CYAN}{'='*70}",
+            f"{Fore.YELLOW}📂 Aufnahmen-Pfad: {self.recordings_path}",
+            f"{Fore.YELLOW}👁️  Standard-Sichtbarkeit: {self.default_visibility.upper()}",
+            f"{Fore.YELLOW}🐛 Debug-Modus: {'AN' if self.debug_mode else 'AUS'}",
+            f"{Fore.CYAN}🔧 Quota-Optimierung: Aktiviert (Playlist-Caching)",
+            f"{Fore.CYAN}{'='*70}",
+            "",
+        ])
         
     def _print_quota_info(self, video_count: int):
         """Zeigt Quota-Verbrauchsinformationen"""
-        print(f"\n{Fore.BLUE}📊 YOUTUBE DATA API QUOTA-INFORMATION")
-        print(f"{Fore.BLUE}{'='*50}")
-        
         # Schätze Quota-Verbrauch
         video_upload_quota = video_count * 1600  # ~1600 Punkte pro Video
         playlist_list_quota = 1  # Einmalig durch Cache
@@ -109,29 +561,46 @@ class YouTubeUploader:
         
         total_estimated_quota = video_upload_quota + playlist_list_quota + playlist_create_quota + playlist_add_quota
         
-        print(f"{Fore.YELLOW}📤 Video Uploads: {video_count} × 1600 = {video_upload_quota:,} Punkte")
-        print(f"{Fore.YELLOW}📋 Playlist-Liste: 1 × 1 = {playlist_list_quota} Punkte (gecacht)")
-        print(f"{Fore.YELLOW}➕ Playlist-Erstellung: ~{playlist_create_quota} Punkte")
-        print(f"{Fore.YELLOW}📝 Playlist-Zuordnungen: {video_count} × 150 = {playlist_add_quota:,} Punkte")
-        print(f"{Fore.CYAN}📊 Geschätzter Gesamt-Verbrauch: {total_estimated_quota:,} Punkte")
+        lines = [
+            "",
+            f"{Fore.BLUE}📊 YOUTUBE DATA API QUOTA-INFORMATION",
+            f"{Fore.BLUE}{'='*50}",
+            f"{Fore.YELLOW}📤 Video Uploads: {video_count} × 1600 = {video_upload_quota:,} Punkte",
+            f"{Fore.YELLOW}📋 Playlist-Liste: 1 × 1 = {playlist_list_quota} Punkte (gecacht)",
+            f"{Fore.YELLOW}➕ Playlist-Erstellung: ~{playlist_create_quota} Punkte",
+            f"{Fore.YELLOW}📝 Playlist-Zuordnungen: {video_count} × 150 = {playlist_add_quota:,} Punkte",
+            f"{Fore.CYAN}📊 Geschätzter Gesamt-Verbrauch: {total_estimated_quota:,} Punkte",
+        ]
+        
+        if self._quota_limit:
+            with self._quota_lock:
+                used_today = self._get_quota_state_locked()['used']
+            lines.append(f"{Fore.CYAN}📅 Heute bereits verbraucht (lokal gezählt): "
+                         f"{used_today:,}/{self._quota_limit:,} Punkte")
         
         if total_estimated_quota > 10000:
-            print(f"{Fore.RED}⚠️  WARNUNG: Geschätzter Verbrauch überschreitet Standard-Quota (10.000 Punkte)")
-            print(f"{Fore.YELLOW}💡 Empfehlung: Quota-Erhöhung beantragen oder weniger Videos uploaden")
+            lines.append(f"{Fore.RED}⚠️  WARNUNG: Geschätzter Verbrauch überschreitet Standard-Quota (10.000 Punkte)")
+            lines.append(f"{Fore.YELLOW}💡 Empfehlung: Quota-Erhöhung beantragen oder weniger Videos uploaden")
         else:
-            print(f"{Fore.GREEN}✅ Quota-Verbrauch im normalen Bereich")
+            lines.append(f"{Fore.GREEN}✅ Quota-Verbrauch im normalen Bereich")
             
-        print(f"{Fore.BLUE}{'='*50}\n")
+        lines += [f"{Fore.BLUE}{'='*50}", ""]
+        self._print_lines(lines)
         
-    def authenticate_youtube(self) -> bool:
-        """Authentifizierung mit der YouTube Data API"""
+    def authenticate_youtube(self, force_reauth: bool = False) -> bool:
+        """Authentifizierung mit der YouTube Data API (force_reauth: gespeichertes Token ignorieren)"""
         try:
+            from google.auth.transport.requests import Request
+            from google.oauth2.credentials import Credentials
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            
             creds = None
-            token_path = 'token.json'
-            credentials_path = 'credentials.json'
             
-            # Lade bestehende Token
-            if os.path.exists(token_path):
+            # Lade bestehende Token (alte token.json im Arbeitsverzeichnis wird übernommen)
+            token_path = self.TOKEN_FILE
+            if not os.path.exists(token_path) and os.path.exists(self.LEGACY_TOKEN_FILE):
+                token_path = self.LEGACY_TOKEN_FILE
+            if not force_reauth and os.path.exists(token_path):
                 creds = Credentials.from_authorized_user_file(token_path, self.SCOPES)
             
             # Wenn keine gültigen Credentials vorhanden sind, führe OAuth-Flow aus
@@ -139,25 +608,21 @@ class YouTubeUploader:
                 if creds and creds.expired and creds.refresh_token:
                     creds.refresh(Request())
                 else:
-                    if not os.path.exists(credentials_path):
-                        print(f"{Fore.RED}❌ Fehler: credentials.json nicht gefunden!")
-                        print(f"{Fore.YELLOW}💡 Bitte erstellen Sie eine OAuth2-Client-ID in der Google Cloud Console:")
-                        print(f"{Fore.YELLOW}   1. Gehen Sie zu https://console.cloud.google.com/")
-                        print(f"{Fore.YELLOW}   2. Erstellen Sie ein neues Projekt oder wählen Sie ein existierendes")
-                        print(f"{Fore.YELLOW}   3. Aktivieren Sie die YouTube Data API v3")
-                        print(f"{Fore.YELLOW}   4. Erstellen Sie OAuth2-Credentials")
-                        print(f"{Fore.YELLOW}   5. Laden Sie die JSON-Datei herunter und benennen Sie sie 'credentials.json'")
+                    if not os.path.exists(self.CREDENTIALS_FILE):
+                        self.print_credentials_help()
                         return False
                     
-                    flow = InstalledAppFlow.from_client_secrets_file(credentials_path, self.SCOPES)
+                    flow = InstalledAppFlow.from_client_secrets_file(self.CREDENTIALS_FILE, self.SCOPES)
                     creds = flow.run_local_server(port=0)
                 
                 # Speichere die Credentials für zukünftige Nutzung
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
+                self._save_token(creds.to_json())
+            elif token_path != self.TOKEN_FILE:
+                self._save_token(creds.to_json())
             
             # Erstelle YouTube API Service
-            self.youtube_service = googleapiclient.discovery.build('youtube', 'v3', credentials=creds)
+            self._credentials = creds
+            self.youtube_service = self._build_service()
             
             print(f"{Fore.GREEN}✅ YouTube-Authentifizierung erfolgreich!")
             return True
@@ -166,6 +631,69 @@ class YouTubeUploader:
             print(f"{Fore.RED}❌ Fehler bei der YouTube-Authentifizierung: {str(e)}")
             return False
     
+    def can_authenticate(self, force_reauth: bool = False) -> bool:
+        """Prüft ohne Netzwerkzugriff, ob ein gespeichertes Token oder credentials.json vorhanden ist"""
+        if os.path.exists(self.CREDENTIALS_FILE):
+            return True
+        return not force_reauth and (os.path.exists(self.TOKEN_FILE) or os.path.exists(self.LEGACY_TOKEN_FILE))
+    
+    @classmethod
+    def print_credentials_help(cls):
+        """Erklärt, wie man die fehlende credentials.json erstellt"""
+        cls._print_lines([
+            f"{Fore.RED}❌ Fehler: {cls.CREDENTIALS_FILE} nicht gefunden!",
+            f"{Fore.YELLOW}💡 Bitte erstellen Sie eine OAuth2-Client-ID in der Google Cloud Console:",
+            f"{Fore.YELLOW}   1. Gehen Sie zu https://console.cloud.google.com/",
+            f"{Fore.YELLOW}   2. Erstellen Sie ein neues Projekt oder wählen Sie ein existierendes",
+            f"{Fore.YELLOW}   3. Aktivieren Sie die YouTube Data API v3",
+            f"{Fore.YELLOW}   4. Erstellen Sie OAuth2-Credentials",
+            f"{Fore.YELLOW}   5. Laden Sie die JSON-Datei herunter und benennen Sie sie '{cls.CREDENTIALS_FILE}'",
+        ])
+    
+    def _save_token(self, token_json: str):
+        """Speichert das OAuth-Token nur für den aktuellen Benutzer lesbar (0600)"""
+        os.makedirs(self.CONFIG_DIR, exist_ok=True)
+        # Atomar ersetzen, damit ein Abbruch beim Schreiben das Refresh-Token nicht zerstört
+        tmp_path = self.TOKEN_FILE + '.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as token:
+            token.write(token_json)
+        # Rechte auch bei einer liegengebliebenen Temp-Datei einschränken
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.TOKEN_FILE)
+    
+    def _build_service(self):
+        """Erstellt einen API-Service über eine eigene, autorisierte HTTP-Verbindung"""
+        import google_auth_httplib2
+        import httplib2
+        
+        # Keep-Alive: Uploads und Playlist-Aufrufe sparen sich den TCP/TLS-Handshake
+        authed_http = google_auth_httplib2.AuthorizedHttp(
+            self._credentials, http=httplib2.Http(timeout=self.HTTP_TIMEOUT))
+        
+        # Discovery-Dokument nur einmal pro Prozess lesen (jeder Upload-Thread baut einen eigenen Service)
+        discovery = _get_youtube_module()
+        document = _get_youtube_discovery_document()
+        if document is None:
+            return discovery.build('youtube', 'v3', http=authed_http, cache_discovery=False)
+        return discovery.build_from_document(document, http=authed_http)
+    
+    def _throttle_api(self, requests: int = 1):
+        """Wartet vor API-Aufrufen auf freie Kapazität des Rate-Limiters (falls aktiviert)"""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(requests)
+    
+    def _get_service(self):
+        """Liefert den API-Service des aktuellen Threads (httplib2-Verbindungen sind nicht thread-sicher)"""
+        if self._credentials is None or threading.current_thread() is threading.main_thread():
+            return self.youtube_service
+        
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = self._build_service()
+            self._thread_local.service = service
+        return service
+    
     def _load_playlist_cache(self):
         """Lädt alle existierenden Playlists einmalig in den Cache (Quota-Optimierung)"""
         if self.playlist_cache_loaded or not self.youtube_service:
@@ -174,23 +702,68 @@ class YouTubeUploader:
         try:
             if self.debug_mode:
                 print(f"{Fore.CYAN}📋 Lade Playlist-Cache (einmalig für Quota-Optimierung)...")
-                
-            request = self.youtube_service.playlists().list(
-                part='snippet',
-                mine=True,
-                maxResults=50
-            )
-            
-            response = request.execute()
             
-            # Speichere alle Playlists im Cache
-            for playlist in response.get('items', []):
-                playlist_name = playlist['snippet']['title']
-                playlist_id = playlist['id']
-                self.playlist_cache[playlist_name] = playlist_id
+            # Gespeicherten Cache vom letzten Lauf laden: Frisch ohne API-Aufruf verwenden, sonst per ETag revalidieren
+            cached_etag = None
+            cached = self._read_playlist_cache_file()
+            if cached is not None:
+                cached_etag, fetched, cached_items = cached
+                if 0 <= time.time() - fetched < self.PLAYLIST_CACHE_TTL:
+                    self._update_playlist_cache(cached_items)
+                    self._playlist_cache_meta = {'etag': cached_etag, 'fetched': fetched}
+                    self.playlist_cache_loaded = True
+                    if self.debug_mode:
+                        print(f"{Fore.GREEN}✅ {len(self.playlist_cache)} Playlist(s) aus lokalem Cache (ohne API-Aufruf)")
+                    return
+            
+            playlists = {}
+            etag = None
+            page_token = None
+            while True:
+                request = self.youtube_service.playlists().list(
+                    part='snippet',
+                    mine=True,
+                    maxResults=50,
+                    pageToken=page_token
+                )
                 
+                if cached_etag and page_token is None:
+                    request.headers['If-None-Match'] = cached_etag
+                
+                try:
+                    self._throttle_api()
+                    self._charge_quota(self.QUOTA_COSTS['list'])
+                    response = request.execute()
+                except googleapiclient.errors.HttpError as e:
+                    if e.resp.status == 304:
+                        # Unverändert seit dem letzten Lauf - gespeicherten Cache verwenden
+                        self._update_playlist_cache(cached_items)
+                        self.playlist_cache_loaded = True
+                        self._playlist_cache_meta = {'etag': cached_etag, 'fetched': time.time()}
+                        self._save_playlist_cache()
+                        if self.debug_mode:
+                            print(f"{Fore.GREEN}✅ {len(self.playlist_cache)} Playlist(s) aus lokalem Cache (unverändert)")
+                        return
+                    raise
+                
+                if etag is None:
+                    etag = response.get('etag')
+                
+                # Speichere alle Playlists im Cache
+                for playlist in response.get('items', []):
+                    playlists[playlist['snippet']['title']] = playlist['id']
+                
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    break
+            
+            self._update_playlist_cache(playlists)
             self.playlist_cache_loaded = True
             
+            if etag:
+                self._playlist_cache_meta = {'etag': etag, 'fetched': time.time()}
+                self._save_playlist_cache()
+            
             if self.debug_mode:
                 print(f"{Fore.GREEN}✅ {len(self.playlist_cache)} Playlist(s) im Cache geladen")
                 
@@ -199,7 +772,49 @@ class YouTubeUploader:
                 print(f"{Fore.YELLOW}⚠️  Warnung: Playlist-Cache konnte nicht geladen werden: {str(e)}")
             self.playlist_cache_loaded = True  # Verhindere weitere Versuche
     
-    def find_videos(self) -> List[Dict]:
+    def _read_playlist_cache_file(self) -> Optional[tuple]:
+        """Liest (ETag, Abrufzeit, Playlists) des gespeicherten Playlist-Caches (None falls fehlend oder defekt)"""
+        for path in (self.PLAYLIST_CACHE_FILE, self.LEGACY_PLAYLIST_CACHE_FILE):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                items = cached.get('items', {})
+                if not isinstance(items, dict):
+                    return None
+                # Alte Cache-Dateien ohne Abrufzeit gelten als abgelaufen
+                return cached.get('etag'), float(cached.get('fetched', 0)), items
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, TypeError, AttributeError):
+                return None  # Defekte Cache-Datei ignorieren
+        return None
+    
+    def _save_playlist_cache(self):
+        """Schreibt den Playlist-Cache für den nächsten Lauf (nur nach einer vollständigen Abfrage)"""
+        if self._playlist_cache_meta is None:
+            return
+        try:
+            os.makedirs(self.CONFIG_DIR, exist_ok=True)
+            # Atomar ersetzen, damit ein Abbruch keine halbe Datei hinterlässt
+            tmp_path = self.PLAYLIST_CACHE_FILE + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(dict(self._playlist_cache_meta, items=self.playlist_cache), f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.PLAYLIST_CACHE_FILE)
+        except OSError as e:
+            if self.debug_mode:
+                tqdm.write(f"{Fore.YELLOW}⚠️  Playlist-Cache konnte nicht gespeichert werden: {str(e)}")
+    
+    @staticmethod
+    def _playlist_key(playlist_name: str) -> str:
+        """Cache-Schlüssel einer Playlist (unabhängig von Groß-/Kleinschreibung und Rand-Leerzeichen)"""
+        return playlist_name.strip().casefold()
+    
+    def _update_playlist_cache(self, playlists: Dict[str, str]):
+        """Übernimmt Playlists (Titel → ID) mit normalisierten Schlüsseln in den Cache"""
+        key = self._playlist_key
+        self.playlist_cache.update((key(title), playlist_id) for title, playlist_id in playlists.items())
+    
+    def find_videos(self) -> List[VideoInfo]:
         """Sucht nach Videos mit den spezifizierten Präfixen"""
         videos = []
         
@@ -209,23 +824,33 @@ class YouTubeUploader:
             
         print(f"{Fore.BLUE}🔍 Durchsuche Verzeichnis: {self.recordings_path}")
         
-        for main_folder_name in self.MAIN_FOLDERS:
-            if not self.recordings_path:
-                continue
+        # Ordner-Scan ist I/O-gebunden: Unterordner parallel durchsuchen (im Debug-Modus seriell für lesbare Ausgabe)
+        executor = None if self.debug_mode else ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) + 4))
+        try:
+            # Erst alle Haupt-Ordner einplanen, dann Ergebnisse in fester Reihenfolge einsammeln
+            scheduled = []
+            for main_folder_name in self.MAIN_FOLDERS:
+                main_folder_path = os.path.join(self.recordings_path, main_folder_name)
                 
-            main_folder_path = Path(self.recordings_path) / main_folder_name
+                if not os.path.exists(main_folder_path):
+                    if self.debug_mode:
+                        print(f"{Fore.YELLOW}⚠️  Ordner nicht gefunden: {main_folder_path}")
+                    continue
+                    
+                print(f"{Fore.BLUE}📂 Durchsuche: {main_folder_name}")
+                parts = list(self._scan_folder_recursive(main_folder_path, main_folder_name, executor=executor))
+                scheduled.append((main_folder_name, parts))
             
-            if not main_folder_path.exists():
-                if self.debug_mode:
-                    print(f"{Fore.YELLOW}⚠️  Ordner nicht gefunden: {main_folder_path}")
-                continue
+            for main_folder_name, parts in scheduled:
+                folder_videos = self._collect_scan_parts(parts)
+                videos.extend(folder_videos)
                 
-            print(f"{Fore.BLUE}📂 Durchsuche: {main_folder_name}")
-            folder_videos = self._scan_folder_recursive(main_folder_path, main_folder_name)
-            videos.extend(folder_videos)
-            
-            if folder_videos:
-                print(f"{Fore.GREEN}   ✅ {len(folder_videos)} Video(s) gefunden in '{main_folder_name}'")
+                if folder_videos:
+                    print(f"{Fore.GREEN}   ✅ {len(folder_videos)} Video(s) gefunden in '{main_folder_name}'")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            self._dir_listing_cache.clear()
         
         self.stats['found_videos'] = len(videos)
         self._categorize_videos(videos)
@@ -239,118 +864,87 @@ class YouTubeUploader:
         """
         if not text:
             return text
-            
-        import re
-        import unicodedata
         
+        # Schnellpfad: Reine ASCII-Titel ohne reparierbare Muster brauchen nur die Leerzeichen-Normalisierung
+        if (text.isascii() and not self._ASCII_REPAIR_RE.search(text)
+                and not (self._repair_missing_umlauts and self._MISSING_UMLAUT_HINT_RE.search(text))):
+            return ' '.join(text.split())
+            
         # Schritt 1: Mehrfache Encoding-Reparatur versuchen
         original_text = text
+        # Nur Zeichen aus dem Latin-1-Oberbereich deuten auf falsch dekodiertes UTF-8 hin
+        has_latin1 = not text.isascii() and self._LATIN1_HIGH_RE.search(text) is not None
         for encoding_attempt in ['latin1', 'cp1252', 'iso-8859-1']:
-            try:
-                # Versuche verschiedene Encoding-Kombinationen
-                if any(ord(c) > 127 and ord(c) < 256 for c in text):
-                    text_bytes = text.encode(encoding_attempt, errors='ignore')
-                    decoded_text = text_bytes.decode('utf-8', errors='replace')
-                    # Behalte nur wenn es besser ist (weniger Replacement Characters)
-                    if decoded_text.count('�') < text.count('�'):
-                        text = decoded_text
-            except:
-                continue
+            if not has_latin1:
+                break
+            # Versuche verschiedene Encoding-Kombinationen
+            # (errors='ignore'/'replace': weder encode noch decode können hier fehlschlagen)
+            text_bytes = text.encode(encoding_attempt, errors='ignore')
+            decoded_text = text_bytes.decode('utf-8', errors='replace')
+            # Behalte nur wenn es besser ist (weniger Replacement Characters)
+            if decoded_text.count('�') < text.count('�'):
+                text = decoded_text
+                has_latin1 = self._LATIN1_HIGH_RE.search(text) is not None
         
         # Schritt 2: Unicode-Normalisierung
-        try:
-            text = unicodedata.normalize('NFC', text)
-        except:
-            pass
+        text = unicodedata.normalize('NFC', text)
         
         # Schritt 3: UNIVERSELLE Pattern-basierte Umlaut-Reparatur
         # Diese Patterns erkennen alle möglichen defekten Umlaute automatisch
         
         # 3a: Replacement Characters (�) oder Fragezeichen (?) in typischen deutschen Kontexten
         # Analysiere den Kontext um den defekten Character zu bestimmen, welcher Umlaut gemeint ist
-        
-        # Pattern für Ä: Häufige Buchstabenkombinationen mit Ä
-        text = re.sub(r'([BCDFGHJKLMNPQRSTVWXYZ])[�?]([BCDFGHJKLMNPQRSTVWXYZ])', 
-                     lambda m: self._guess_umlaut_from_context(m.group(0), m.group(1), m.group(2)), text)
-        
         # 3b: Bekannte deutsche Vokal-Kombinationen reparieren
-        # Ä-Patterns: Typische deutsche Kombinationen wo Ä vorkommt
-        umlaut_patterns = [
-            # Ä Reparatur - häufige deutsche Buchstabenkombinationen
-            (r'([BCDFGKLMNPRSTVWXZ])[�?]([NRTCHDGLMS])', r'\1Ä\2'),  # z.B. ÄNGT, ÄRT, ÄCK
-            (r'([BCDFGHJKLMNPQRSTVWXYZ])[�?]([BCDFGHJKLMNPQRSTVWXYZ][EI])', r'\1Ä\2'),  # vor -E, -ER, -EN, -EL
-            (r'H[�?]([NRTL])', r'HÄ\1'),  # HÄNGT, HÄRT, HÄTTE
-            
-            # Ö Reparatur - typische deutsche Ö-Kombinationen  
-            (r'([BCDFGKLMNPRSTVWXZ])[�?]([NRTL])', r'\1Ö\2'),  # z.B. HÖHRT, KÖNIG, GRÖSSER
-            (r'H[�?][RT]', 'HÖR'),  # HÖRT ist sehr häufig
-            
-            # Ü Reparatur - typische deutsche Ü-Kombinationen
-            (r'([BCDFGKLMNPRSTVWXZ])[�?]([CKHLNRT])', r'\1Ü\2'),  # z.B. GLÜCK, MÜHLE, DRÜCK
-            (r'GL[�?]CK', 'GLÜCK'),  # GLÜCK ist sehr häufig
-            (r'([DFGLMNRSTW])[�?]([HLNRSTCK])', r'\1Ü\2'),  # Breite Abdeckung für Ü
-        ]
-        
-        for pattern, replacement in umlaut_patterns:
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        if '?' in text or '�' in text:  # Ohne defektes Zeichen gibt es hier nichts zu reparieren
+            if self._CLOSE_DEFECTS_RE.search(text):
+                # Überlappende Kontexte: Regeln nacheinander anwenden
+                text = self._CONSONANT_GAP_RE.sub(
+                    lambda m: self._guess_umlaut_from_context(m.group(0), m.group(1), m.group(2)), text)
+                for pattern, replacement in self._UMLAUT_PATTERNS:
+                    text = pattern.sub(replacement, text)
+            else:
+                # Ein Durchlauf: Die erste passende Regel bestimmt die Ersetzung
+                text = self._UMLAUT_CONTEXT_RE.sub(self._repair_defective_char, text)
         
         # 3c: Fehlende Umlaute (komplett weggelassen) - UNIVERSELLE Reparatur
-        # Diese Patterns erkennen deutsche Wörter wo Umlaute weggelassen wurden
-        
         # Analysiere Wörter und füge fehlende Umlaute basierend auf deutschen Sprachmustern hinzu
-        words = text.split()
-        repaired_words = []
-        
-        for word in words:
-            original_word = word
-            
-            # Häufige deutsche Konsonant-Kombinationen die normalerweise Umlaute enthalten
-            # Ä-Ergänzung
-            word = re.sub(r'\b([BCDFGHJKLMNPQRSTVWXYZ]+)NGT\b', r'\1ÄNGT', word)  # -ÄNGT Endung
-            word = re.sub(r'\b([BCDFGHJKLMNPQRSTVWXYZ])RT\b', r'\1ÄRT', word)      # -ÄRT Endung
-            word = re.sub(r'\bH([LNRT]+)\b', r'HÄ\1', word)                        # H + Konsonant = HÄ
-            
-            # Ö-Ergänzung  
-            word = re.sub(r'\bH([RT]+)\b', r'HÖ\1', word)                          # HRT = HÖRT
-            word = re.sub(r'\b([BCDFGKLMNPRSTVWXZ]+)([LNRT]+)([^AEIOU])\b', 
-                         lambda m: f"{m.group(1)}Ö{m.group(2)}{m.group(3)}" if len(m.group(2)) <= 2 else m.group(0), word)
-            
-            # Ü-Ergänzung - sehr häufige deutsche Muster
-            word = re.sub(r'\bGL([CK]+)\b', r'GLÜ\1', word)                        # GLCK = GLÜCK
-            word = re.sub(r'\b([BCDFGKLMNPRSTVWXZ]+)CK\b', 
-                         lambda m: f"{m.group(1)}ÜCK" if len(m.group(1)) <= 3 else m.group(0), word)  # -ÜCK Endung
-            word = re.sub(r'\b([DFGLMNRSTW])([HLNRSTCK]+)\b', 
-                         lambda m: f"{m.group(1)}Ü{m.group(2)}" if len(m.group(2)) <= 3 else m.group(0), word)
-            
-            repaired_words.append(word)
-        
-        text = ' '.join(repaired_words)
-        
-        # Schritt 4: Unicode-Escape-Sequenzen reparieren
-        unicode_escapes = {
-            r'\\udcc4': 'Ä', r'\\udce4': 'ä',
-            r'\\udcd6': 'Ö', r'\\udcf6': 'ö', 
-            r'\\udcdc': 'Ü', r'\\udcfc': 'ü',
-            r'\\udcdf': 'ß'
-        }
+        # Alle Wort-Patterns beginnen mit zwei Großbuchstaben-Konsonanten - ohne solchen Wortanfang nur normalisieren
+        # Nur mit REPAIR_MISSING_UMLAUTS=true: die Muster erkennen Abkürzungen nicht ('PUBG SCHN' → 'PUBG SÜCHN')
+        if self._repair_missing_umlauts and self._MISSING_UMLAUT_HINT_RE.search(text):
+            repaired_words = []
+            
+            for word in text.split():
+                for pattern, replacement in self._WORD_PATTERNS:
+                    word = pattern.sub(replacement, word)
+                repaired_words.append(word)
+            
+            text = ' '.join(repaired_words)
+        else:
+            text = ' '.join(text.split())
         
-        for escape, char in unicode_escapes.items():
-            text = re.sub(escape, char, text)
+        # Schritt 4: Unicode-Escape-Sequenzen reparieren (ein Durchlauf für alle Escapes)
+        text = self._UNICODE_ESCAPE_RE.sub(lambda m: self._UNICODE_ESCAPES[m.group(0)], text)
+        text = text.translate(self._SURROGATE_TABLE)
         
         # Schritt 5: Finale Bereinigung
-        # Entferne verbleibende defekte Zeichen
-        text = re.sub(r'[�]+', '', text)                    # Replacement Characters entfernen
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F]', '', text)  # Steuerzeichen entfernen
-        text = re.sub(r'\s+', ' ', text)                    # Mehrfache Leerzeichen normalisieren
-        text = text.strip()
+        # Entferne Replacement Characters und Steuerzeichen in einem Durchlauf
+        text = text.translate(self._STRIP_TABLE)
+        text = ' '.join(text.split())           # Mehrfache Leerzeichen normalisieren (inkl. strip)
         
         # Schritt 6: Fallback - wenn alles fehlschlägt, verwende Original mit grundlegender Bereinigung
         if not text or len(text) < len(original_text) * 0.7:  # Zu viel verloren
-            text = re.sub(r'[�?]+', '', original_text)
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = ' '.join(original_text.translate(self._FALLBACK_STRIP_TABLE).split())
         
         return text
     
+    def _repair_defective_char(self, match: re.Match) -> str:
+        """Ersetzung für _UMLAUT_CONTEXT_RE: Wendet die Regel der getroffenen Alternative an"""
+        matched = match.group(0)
+        replace = self._UMLAUT_CONTEXT_RULES[int(match.lastgroup[1:])][1]
+        if replace is None:
+            return self._guess_umlaut_from_context(matched, matched[0], matched[2])
+        return replace(matched)
+    
     def _guess_umlaut_from_context(self, full_match: str, before: str, after: str) -> str:
         """Hilfsfunktion: Rät den korrekten Umlaut basierend auf dem Kontext"""
         context = before + after
@@ -370,121 +964,159 @@ class YouTubeUploader:
             # Fallback basierend auf häufigsten deutschen Umlauten
             return before + 'Ä' + after  # Ä ist statistisch am häufigsten
     
-    def _scan_folder_recursive(self, folder_path: Path, main_folder: str, current_path: Optional[List[str]] = None) -> List[Dict]:
-        """Rekursive Suche nach Videos in Ordnern"""
+    def _scan_folder_recursive(self, folder_path: str, main_folder: str, current_path: Optional[List[str]] = None,
+                               executor: Optional[ThreadPoolExecutor] = None) -> Iterator:
+        """Rekursive Suche nach Videos in Ordnern (mit executor: Unterordner als Futures, siehe _collect_scan_parts)"""
         if current_path is None:
             current_path = [main_folder]
             
-        videos = []
-        
         try:
-            for item in folder_path.iterdir():
-                if item.is_file() and self._is_video_file(item):
-                    video_info = self._analyze_video_file(item, current_path.copy())
+            # Phase 1: Verzeichnis einmal komplett lesen (os.scandir liefert den Dateityp direkt aus dem Listing)
+            # und Handle schließen, bevor in Unterordner abgestiegen wird
+            with os.scandir(folder_path) as it:
+                entries = list(it)
+            # Listing für die Original-Datei-Suche der Geschwister-Videos merken
+            self._dir_listing_cache[folder_path] = frozenset(entry.name for entry in entries)
+            
+            # Phase 2: stat() für alle Video-Kandidaten dieses Ordners gesammelt abfragen
+            stat_results = {}
+            for entry in entries:
+                if entry.is_file() and self._is_video_file(entry.name):
+                    try:
+                        stat_results[entry.name] = entry.stat()
+                    except OSError:
+                        pass  # Datei während des Scans verschwunden
+            
+            # Phase 3: In Listing-Reihenfolge analysieren bzw. in Unterordner absteigen
+            for entry in entries:
+                stat_result = stat_results.get(entry.name)
+                if stat_result is not None:
+                    video_info = self._analyze_video_file(entry.path, current_path.copy(), stat_result)
                     if video_info:
-                        videos.append(video_info)
-                        
-                elif item.is_dir():
+                        yield video_info
+
+                elif entry.is_dir():
+                    item = entry.path
                     # Prüfe ob der Ordner selbst ein Upload-Ordner ist (mit merged_ oder unmergable_ Präfix)
-                    if self._is_upload_folder(item):
+                    if self._is_upload_folder(entry.name):
                         # Durchsuche diesen Ordner und alle Videos darin sollen hochgeladen werden
-                        folder_videos = self._scan_upload_folder(item, main_folder, current_path.copy())
-                        videos.extend(folder_videos)
+                        scan, args = self._scan_upload_folder, (item, main_folder, current_path.copy())
                     else:
                         # Normale rekursive Suche in Unterordner
-                        sub_path = current_path + [item.name]
-                        sub_videos = self._scan_folder_recursive(item, main_folder, sub_path)
-                        videos.extend(sub_videos)
+                        scan, args = self._scan_folder_recursive, (item, main_folder, current_path + [entry.name])
+                    
+                    if executor is not None:
+                        # Nur die oberste Ebene verteilt auf den Pool - Worker warten nie auf andere Futures
+                        # (der Generator wird im Worker per list() abgearbeitet)
+                        yield executor.submit(list, scan(*args))
+                    else:
+                        yield from scan(*args)
                         
         except PermissionError:
             if self.debug_mode:
                 print(f"{Fore.YELLOW}⚠️  Keine Berechtigung für: {folder_path}")
-                
-        return videos
     
-    def _is_upload_folder(self, folder_path: Path) -> bool:
-        """Prüft, ob ein Ordner ein Upload-Ordner ist (mit merged_ oder unmergable_ Präfix)"""
-        folder_name = folder_path.name
-        
+    def _collect_scan_parts(self, parts: List) -> List[VideoInfo]:
+        """Löst die Futures eines parallelen Scans in Listing-Reihenfolge auf"""
+        return list(chain.from_iterable(
+            part.result() if isinstance(part, Future) else (part,) for part in parts))
+    
+    def _is_upload_folder(self, folder_name: str) -> bool:
+        """Prüft anhand des Ordnernamens, ob ein Ordner ein Upload-Ordner ist (mit merged_ oder unmergable_ Präfix)"""
         # Prüfe auf Upload-Präfixe in Ordnernamen
-        has_upload_prefix = any(folder_name.startswith(prefix) for prefix in self.VIDEO_PREFIXES)
+        has_upload_prefix = folder_name.startswith(self.VIDEO_PREFIXES)
         
         # Überspringe bereits verarbeitete Ordner
         already_processed = folder_name.startswith(self.UPLOADED_PREFIX)
         
         return has_upload_prefix and not already_processed
     
-    def _scan_upload_folder(self, folder_path: Path, main_folder: str, current_path: List[str]) -> List[Dict]:
+    def _scan_upload_folder(self, folder_path: str, main_folder: str, current_path: List[str]) -> Iterator[VideoInfo]:
         """Durchsucht einen Upload-Ordner und behandelt alle Videos darin als Upload-bereit"""
-        videos = []
-        folder_name = folder_path.name
-        
-        # Bestimme Video-Typ basierend auf Ordner-Präfix
-        if folder_name.startswith('merged_'):
-            video_type = 'merged'
-        elif folder_name.startswith('onlymic_'):
-            video_type = 'onlymic'
-        elif folder_name.startswith('onlydesktop_'):
-            video_type = 'onlydesktop'
+        found_count = 0
+        folder_name = os.path.basename(folder_path)
+        
+        # Bestimme Video-Typ basierend auf Ordner-Präfix und entferne das Präfix für die Pfad-Struktur
+        prefix_match = self._VIDEO_PREFIX_RE.match(folder_name)
+        if prefix_match:
+            video_type = prefix_match.group(1)
+            clean_folder_name = folder_name[prefix_match.end():]
         else:
             video_type = 'unmergable'
-        
-        # Entferne Präfix vom Ordnernamen für die Pfad-Struktur
-        clean_folder_name = folder_name
-        for prefix in self.VIDEO_PREFIXES:
-            if folder_name.startswith(prefix):
-                clean_folder_name = folder_name[len(prefix):]
-                break
+            clean_folder_name = folder_name
         
         # Aktualisiere Pfad-Struktur mit bereinigtem Ordnernamen
         folder_path_structure = current_path + [clean_folder_name]
         
         if self.debug_mode:
-            print(f"{Fore.CYAN}🎯 Upload-Ordner gefunden: {folder_name} (Typ: {video_type})")
+            print(f"{Fore.CYAN}🎯 Upload-Ordner gefunden: {self._printable(folder_name)} (Typ: {video_type})")
         
+        # Durchsuche den Upload-Ordner rekursiv nach allen Video-Dateien
+        # (gleiche Reihenfolge wie os.walk: erst die Dateien eines Ordners, dann die Unterordner)
+        for entry, full_path_structure in self._walk_upload_folder(folder_path, folder_path_structure):
+            # Ein stat() pro Kandidat: Dateityp, Größe und Datum (DirEntry cacht das Ergebnis)
+            try:
+                stat_result = entry.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(stat_result.st_mode):
+                continue
+            
+            video_info = self._analyze_upload_folder_video(
+                entry.path, full_path_structure.copy(), video_type, stat_result)
+            if video_info:
+                found_count += 1
+                yield video_info
+        
+        if found_count and self.debug_mode:
+            print(f"{Fore.GREEN}   📁 {found_count} Video(s) in Upload-Ordner '{self._printable(folder_name)}' gefunden")
+    
+    def _walk_upload_folder(self, folder_path: str, path_structure: List[str]) -> Iterator:
+        """Liefert (DirEntry, Pfad-Struktur) aller Video-Kandidaten eines Upload-Ordners (ohne Symlink-Ordner)"""
         try:
-            # Durchsuche den Upload-Ordner rekursiv nach allen Video-Dateien
-            for item in folder_path.rglob('*'):
-                if item.is_file() and self._is_supported_video_format(item):
-                    # Berechne relative Pfad-Struktur innerhalb des Upload-Ordners
-                    relative_path = item.relative_to(folder_path)
-                    sub_folders = list(relative_path.parent.parts) if relative_path.parent.parts != ('.',) else []
-                    
-                    # Erstelle vollständige Pfad-Struktur
-                    full_path_structure = folder_path_structure + sub_folders
-                    
-                    video_info = self._analyze_upload_folder_video(item, full_path_structure, video_type)
-                    if video_info:
-                        videos.append(video_info)
-                        
+            with os.scandir(folder_path) as it:
+                entries = list(it)
         except PermissionError:
             if self.debug_mode:
                 print(f"{Fore.YELLOW}⚠️  Keine Berechtigung für Upload-Ordner: {folder_path}")
+            return
+        except OSError:
+            return
         
-        if videos and self.debug_mode:
-            print(f"{Fore.GREEN}   📁 {len(videos)} Video(s) in Upload-Ordner '{folder_name}' gefunden")
-            
-        return videos
-    
-    def _is_supported_video_format(self, file_path: Path) -> bool:
-        """Prüft, ob eine Datei ein unterstütztes Video-Format hat und noch nicht hochgeladen wurde"""
-        if file_path.suffix.lower() not in self.SUPPORTED_FORMATS:
+        # Nur Namen prüfen - auf das Dateisystem wird erst für passende Dateien zugegriffen
+        sub_dirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                sub_dirs.append(entry)
+            elif self._is_supported_video_format(entry.name):
+                yield entry, path_structure
+        
+        for entry in sub_dirs:
+            yield from self._walk_upload_folder(entry.path, path_structure + [entry.name])
+
+    def _is_supported_video_format(self, filename: str) -> bool:
+        """Prüft anhand des Dateinamens, ob eine Datei ein unterstütztes Video-Format hat und noch nicht hochgeladen wurde"""
+        if not filename.lower().endswith(self.SUPPORTED_FORMATS_TUPLE):
             return False
-            
-        filename = file_path.name
         
         # Überspringe bereits hochgeladene Videos
         already_uploaded = filename.startswith(self.UPLOADED_PREFIX)
         
         return not already_uploaded
     
-    def _analyze_upload_folder_video(self, file_path: Path, folder_structure: List[str], video_type: str) -> Optional[Dict]:
+    def _analyze_upload_folder_video(self, file_path: str, folder_structure: List[str], video_type: str,
+                                     stat_result: Optional[os.stat_result] = None) -> Optional[VideoInfo]:
         """Analysiert ein Video aus einem Upload-Ordner"""
         try:
-            filename = file_path.name
+            filename = os.path.basename(file_path)
+            st = stat_result if stat_result is not None else os.stat(file_path)
             
             # Verwende Dateinamen als Titel (ohne Dateiendung)
-            title = file_path.stem
+            title = os.path.splitext(filename)[0]
             
             # Bereinige Titel (ersetze Unterstriche durch Leerzeichen und behebe Encoding-Probleme)
             title = title.replace('_', ' ').strip()
@@ -492,79 +1124,86 @@ class YouTubeUploader:
             # Verwende die generelle Encoding-Fix-Funktion
             title = self._fix_encoding_issues(title)
             
-            # Bestimme Aufnahmedatum
-            try:
-                record_date = datetime.fromtimestamp(file_path.stat().st_mtime)
-            except:
-                record_date = datetime.now()
+            # Aufnahmedatum = Änderungszeit der Datei
+            record_mtime = st.st_mtime
             
             # Bestimme Playlist-Hierarchie
             playlist_info = self._determine_playlists(folder_structure)
             
-            video_info = {
-                'file_path': str(file_path),
+            video_info: VideoInfo = {
+                'file_path': file_path,
                 'filename': filename,
                 'title': title,
                 'video_type': video_type,  # Vom Ordner bestimmt
                 'folder_structure': folder_structure,
                 'playlist_info': playlist_info,
-                'record_date': record_date,
-                'file_size': file_path.stat().st_size,
-                'file_size_mb': round(file_path.stat().st_size / (1024 * 1024), 2),
+                'record_mtime': record_mtime,
+                'record_date_str': self._format_record_date(record_mtime),
+                'file_size': st.st_size,
                 'from_upload_folder': True  # Markierung für Upload-Ordner-Videos
             }
             
             if self.debug_mode:
-                print(f"{Fore.CYAN}🔍 Upload-Ordner-Video analysiert: {filename}")
-                print(f"   📁 Ordner-Struktur: {' > '.join(folder_structure)}")
-                print(f"   🎬 Titel: {title}")
-                print(f"   🎯 Typ: {video_type}")
-                print(f"   📊 Größe: {video_info['file_size_mb']} MB")
+                self._print_lines([
+                    f"{Fore.CYAN}🔍 Upload-Ordner-Video analysiert: {self._printable(filename)}",
+                    f"   📁 Ordner-Struktur: {self._printable(' > '.join(folder_structure))}",
+                    f"   🎬 Titel: {title}",
+                    f"   🎯 Typ: {video_type}",
+                    f"   📊 Größe: {st.st_size / (1024 * 1024):.2f} MB",
+                ])
                 
             return video_info
             
-        except Exception as e:
+        except OSError as e:
             if self.debug_mode:
-                print(f"{Fore.RED}❌ Fehler beim Analysieren von Upload-Ordner-Video {file_path}: {str(e)}")
+                print(f"{Fore.RED}❌ Fehler beim Analysieren von Upload-Ordner-Video {self._printable(file_path)}: {str(e)}")
             return None
     
-    def _is_video_file(self, file_path: Path) -> bool:
-        """Prüft, ob eine Datei ein unterstütztes Video ist"""
-        if file_path.suffix.lower() not in self.SUPPORTED_FORMATS:
+    def _format_record_date(self, mtime: float) -> str:
+        """Formatiert einen Aufnahmezeitpunkt (ungültige Zeitstempel → aktuelle Zeit)"""
+        try:
+            return time.strftime(self.RECORD_DATE_FORMAT, time.localtime(mtime))
+        except (OSError, OverflowError, ValueError):
+            return time.strftime(self.RECORD_DATE_FORMAT)
+    
+    def _list_dir_names(self, folder_path: str) -> frozenset:
+        """Liefert die Namen aller Einträge eines Ordners (pro Scan gecacht, leer bei Lesefehlern)"""
+        names = self._dir_listing_cache.get(folder_path)
+        if names is None:
+            try:
+                with os.scandir(folder_path) as it:
+                    names = frozenset(entry.name for entry in it)
+            except OSError:
+                names = frozenset()
+            self._dir_listing_cache[folder_path] = names
+        return names
+    
+    def _is_video_file(self, filename: str) -> bool:
+        """Prüft anhand des Dateinamens, ob eine Datei ein unterstütztes Video ist"""
+        # Präfix zuerst prüfen: billiger und schließt die meisten Dateien (original_*, uploaded_*) bereits aus
+        # (uploaded_ ist kein Upload-Präfix, bereits hochgeladene Videos fallen hier also ebenfalls heraus)
+        if not filename.startswith(self.VIDEO_PREFIXES):
             return False
-            
-        filename = file_path.name
-        
-        # Prüfe auf gewünschte Präfixe
-        has_prefix = any(filename.startswith(prefix) for prefix in self.VIDEO_PREFIXES)
-        
-        # Überspringe bereits hochgeladene Videos
-        already_uploaded = filename.startswith(self.UPLOADED_PREFIX)
         
-        return has_prefix and not already_uploaded
+        return filename.lower().endswith(self.SUPPORTED_FORMATS_TUPLE)
     
-    def _analyze_video_file(self, file_path: Path, folder_structure: List[str]) -> Optional[Dict]:
+    def _analyze_video_file(self, file_path: str, folder_structure: List[str],
+                            stat_result: Optional[os.stat_result] = None) -> Optional[VideoInfo]:
         """Analysiert eine Video-Datei und extrahiert Metadaten"""
         try:
-            filename = file_path.name
-            
-            # Bestimme Video-Typ
-            if filename.startswith('merged_'):
-                video_type = 'merged'
-            elif filename.startswith('onlymic_'):
-                video_type = 'onlymic'
-            elif filename.startswith('onlydesktop_'):
-                video_type = 'onlydesktop'
+            parent, filename = os.path.split(file_path)
+            stem, suffix = os.path.splitext(filename)
+            # stat() aus dem Scan wiederverwenden, sonst einmalig abfragen
+            st = stat_result if stat_result is not None else os.stat(file_path)
+            
+            # Bestimme Video-Typ und extrahiere Titel (entferne Präfix und Dateiendung)
+            prefix_match = self._VIDEO_PREFIX_RE.match(filename)
+            if prefix_match:
+                video_type = prefix_match.group(1)
+                title = filename[prefix_match.end():].rsplit('.', 1)[0]
             else:
                 video_type = 'unmergable'
-            
-            # Extrahiere Titel (entferne Präfix und Dateiendung)
-            for prefix in self.VIDEO_PREFIXES:
-                if filename.startswith(prefix):
-                    title = filename[len(prefix):].rsplit('.', 1)[0]
-                    break
-            else:
-                title = file_path.stem
+                title = stem
                 
             # Bereinige Titel (ersetze Unterstriche durch Leerzeichen und behebe Encoding-Probleme)
             title = title.replace('_', ' ').strip()
@@ -576,76 +1215,80 @@ class YouTubeUploader:
             try:
                 # Versuche zuerst modification time der Original-Datei basierend auf bereinigtem Titel
                 clean_title_for_original = title.replace(' ', '_')  # Für Dateiname-Suche
-                original_file = file_path.parent / f"original_{clean_title_for_original}.{file_path.suffix[1:]}"
-                
-                if not original_file.exists():
-                    # Fallback: Suche nach Original-Datei ohne Präfixe im gleichen Ordner
-                    original_file = file_path.parent / f"{clean_title_for_original}.{file_path.suffix[1:]}"
+                extension = suffix[1:]
+                possible_names = [
+                    f"original_{clean_title_for_original}.{extension}",
+                    f"{clean_title_for_original}.{extension}",  # Ohne Präfix
+                    f"original {title}.{extension}",  # Mit Leerzeichen
+                    f"{title}.{extension}"  # Ohne Präfix, mit Leerzeichen
+                ]
                 
-                if not original_file.exists():
-                    # Fallback 2: Suche nach allen möglichen Original-Dateien im Ordner
-                    possible_names = [
-                        f"original_{clean_title_for_original}.{file_path.suffix[1:]}",
-                        f"{clean_title_for_original}.{file_path.suffix[1:]}",
-                        f"original {title}.{file_path.suffix[1:]}",  # Mit Leerzeichen
-                        f"{title}.{file_path.suffix[1:]}"  # Ohne Präfix, mit Leerzeichen
-                    ]
-                    
-                    for possible_name in possible_names:
-                        potential_file = file_path.parent / possible_name
-                        if potential_file.exists():
-                            original_file = potential_file
-                            break
+                # Einmal das Verzeichnis lesen statt eines exists() pro Kandidat
+                sibling_names = self._list_dir_names(parent)
+                original_name = None
+                for possible_name in possible_names:
+                    if possible_name in sibling_names:
+                        original_name = possible_name
+                        break
                 
-                if original_file.exists():
-                    record_date = datetime.fromtimestamp(original_file.stat().st_mtime)
+                if original_name is not None:
+                    record_mtime = os.stat(os.path.join(parent, original_name)).st_mtime
                     if self.debug_mode:
-                        print(f"   📅 Original-Datei gefunden: {original_file.name}")
+                        print(f"   📅 Original-Datei gefunden: {self._printable(original_name)}")
                 else:
-                    record_date = datetime.fromtimestamp(file_path.stat().st_mtime)
+                    record_mtime = st.st_mtime
                     if self.debug_mode:
                         print(f"   📅 Verwende merged-Datei Datum (Original nicht gefunden)")
-            except:
-                record_date = datetime.now()
+            except OSError:
+                record_mtime = time.time()
             
             # Bestimme Playlist-Hierarchie
             playlist_info = self._determine_playlists(folder_structure)
             
-            video_info = {
-                'file_path': str(file_path),
+            video_info: VideoInfo = {
+                'file_path': file_path,
                 'filename': filename,
                 'title': title,
                 'video_type': video_type,
                 'folder_structure': folder_structure,
                 'playlist_info': playlist_info,
-                'record_date': record_date,
-                'file_size': file_path.stat().st_size,
-                'file_size_mb': round(file_path.stat().st_size / (1024 * 1024), 2)
+                'record_mtime': record_mtime,
+                'record_date_str': self._format_record_date(record_mtime),
+                'file_size': st.st_size
             }
             
             if self.debug_mode:
-                print(f"{Fore.CYAN}🔍 Analysiert: {filename}")
-                print(f"   📁 Ordner-Struktur: {' > '.join(folder_structure)}")
-                print(f"   🎬 Titel: {title}")
-                print(f"   📊 Größe: {video_info['file_size_mb']} MB")
+                self._print_lines([
+                    f"{Fore.CYAN}🔍 Analysiert: {self._printable(filename)}",
+                    f"   📁 Ordner-Struktur: {self._printable(' > '.join(folder_structure))}",
+                    f"   🎬 Titel: {title}",
+                    f"   📊 Größe: {st.st_size / (1024 * 1024):.2f} MB",
+                ])
                 
             return video_info
             
-        except Exception as e:
+        except OSError as e:
             if self.debug_mode:
-                print(f"{Fore.RED}❌ Fehler beim Analysieren von {file_path}: {str(e)}")
+                print(f"{Fore.RED}❌ Fehler beim Analysieren von {self._printable(file_path)}: {str(e)}")
             return None
     
-    def _determine_playlists(self, folder_structure: List[str]) -> Dict:
+    def _determine_playlists(self, folder_structure: List[str]) -> PlaylistInfo:
         """Bestimmt die Playlist-Zuordnung basierend auf der Ordner-Struktur"""
-        playlist_info = {
+        # Videos eines Ordners teilen sich die gecachte Zuordnung, jedes Video bekommt davon eine eigene Kopie
+        return self._playlists_for_structure(tuple(folder_structure)).copy()
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _playlists_for_structure(folder_structure: Tuple[str, ...]) -> PlaylistInfo:
+        """Berechnet die Playlist-Zuordnung einer Ordner-Struktur (gecacht pro Struktur, daher nur Tupel)"""
+        playlist_info: PlaylistInfo = {
             'main_folder': folder_structure[0] if folder_structure else None,
             'game_folder': folder_structure[1] if len(folder_structure) > 1 else None,
-            'sub_folders': folder_structure[2:] if len(folder_structure) > 2 else [],
+            'sub_folders': folder_structure[2:],
             'all_folders': folder_structure,
-            'potential_playlists': [],
+            'potential_playlists': (),
             'primary_playlist': None,
-            'additional_playlists': []
+            'additional_playlists': ()
         }
         
         # Erstelle potentielle Playlists (vom spezifischsten zum allgemeinsten)
@@ -655,95 +1298,98 @@ class YouTubeUploader:
             # Primäre Playlist: BUG (spezifischster)
             playlist_info['primary_playlist'] = folder_structure[-1]
             # Potentielle Playlists: BUG, Star Wars Jedi Fallen Order, SPIEL AUFNAHMEN (rückwärts)
-            playlist_info['potential_playlists'] = list(reversed(folder_structure))
+            playlist_info['potential_playlists'] = folder_structure[::-1]
             # Zusätzliche Playlists: Star Wars Jedi Fallen Order, SPIEL AUFNAHMEN
-            playlist_info['additional_playlists'] = list(reversed(folder_structure[:-1]))
+            playlist_info['additional_playlists'] = folder_structure[-2::-1]
             
         elif len(folder_structure) > 1:
             # Beispiel: ['SPIEL AUFNAHMEN', 'Grand Theft Auto V']
             # Primäre Playlist: Grand Theft Auto V
             playlist_info['primary_playlist'] = folder_structure[1]
             # Potentielle Playlists: Grand Theft Auto V, SPIEL AUFNAHMEN
-            playlist_info['potential_playlists'] = list(reversed(folder_structure))
+            playlist_info['potential_playlists'] = folder_structure[::-1]
             # Zusätzliche Playlists: SPIEL AUFNAHMEN
-            playlist_info['additional_playlists'] = [folder_structure[0]]
+            playlist_info['additional_playlists'] = (folder_structure[0],)
             
         else:
             # Nur Hauptordner verfügbar
             playlist_info['primary_playlist'] = folder_structure[0]
             playlist_info['potential_playlists'] = folder_structure
-            playlist_info['additional_playlists'] = []
+            playlist_info['additional_playlists'] = ()
         
         return playlist_info
     
     def _clean_title_for_display(self, title: str) -> str:
-        """Bereinigt Titel für saubere Konsolen-Ausgabe"""
+        """Bereinigt Titel für saubere Konsolen-Ausgabe (Ergebnis wird pro Titel gecacht)"""
+        cached = self._title_cache.get(title)
+        if cached is not None:
+            return cached
+        
         # Verwende die generelle Encoding-Fix-Funktion für konsistente Behandlung
         clean_title = self._fix_encoding_issues(title)
         
         # Zusätzliche Bereinigung für Terminal-Ausgabe
-        import re
         # Entferne verbleibende problematische Zeichen für Terminal
-        clean_title = re.sub(r'[^\x20-\x7E\u00C0-\u017F\u00C4\u00D6\u00DC\u00E4\u00F6\u00FC\u00DF]', '', clean_title)
+        clean_title = self._DISPLAY_STRIP_RE.sub('', clean_title).strip()
         
-        return clean_title.strip() if clean_title.strip() else title
+        result = clean_title if clean_title else title
+        self._title_cache[title] = result
+        return result
     
-    def _categorize_videos(self, videos: List[Dict]):
+    def _categorize_videos(self, videos: List[VideoInfo]):
         """Kategorisiert gefundene Videos für Statistiken"""
         for video in videos:
-            if video['video_type'] == 'merged':
-                self.stats['merged_videos'] += 1
-            elif video['video_type'] == 'onlymic':
-                self.stats['onlymic_videos'] += 1
-            elif video['video_type'] == 'onlydesktop':
-                self.stats['onlydesktop_videos'] += 1
-            else:  # unmergable
-                self.stats['unmergable_videos'] += 1
-    
-    def preview_videos(self, videos: List[Dict]):
+            self.stats[self._STATS_KEY_BY_TYPE.get(video['video_type'], 'unmergable_videos')] += 1
+    
+    def preview_videos(self, videos: List[VideoInfo]):
         """Zeigt eine Vorschau der gefundenen Videos"""
         if not videos:
             print(f"{Fore.YELLOW}📭 Keine Videos zum Upload gefunden.")
             return
             
-        print(f"\n{Fore.GREEN}🎬 {len(videos)} Video(s) bereit für Upload:")
-        print(f"{Fore.GREEN}   📹 Merged Videos: {self.stats['merged_videos']}")
-        print(f"{Fore.GREEN}   📼 Unmergable Videos: {self.stats['unmergable_videos']}")
-        print(f"{Fore.GREEN}   🎤 OnlyMic Videos: {self.stats['onlymic_videos']}")
-        print(f"{Fore.GREEN}   🔊 OnlyDesktop Videos: {self.stats['onlydesktop_videos']}")
-        
-        print(f"\n{Fore.CYAN}{'='*70}")
-        print(f"{Fore.CYAN}📋 DETAILLIERTE VIDEO-ÜBERSICHT")
-        print(f"{Fore.CYAN}{'='*70}")
+        # Gesamte Übersicht sammeln und mit einem Schreibvorgang ausgeben
+        lines = [
+            f"\n{Fore.GREEN}🎬 {len(videos)} Video(s) bereit für Upload:",
+            f"{Fore.GREEN}   📹 Merged Videos: {self.stats['merged_videos']}",
+            f"{Fore.GREEN}   📼 Unmergable Videos: {self.stats['unmergable_videos']}",
+            f"{Fore.GREEN}   🎤 OnlyMic Videos: {self.stats['onlymic_videos']}",
+            f"{Fore.GREEN}   🔊 OnlyDesktop Videos: {self.stats['onlydesktop_videos']}",
+            f"\n{Fore.CYAN}{'='*70}",
+            f"{Fore.CYAN}📋 DETAILLIERTE VIDEO-ÜBERSICHT",
+            f"{Fore.CYAN}{'='*70}",
+        ]
+        append = lines.append
         
         for i, video in enumerate(videos, 1):
             clean_title = self._clean_title_for_display(video['title'])
-            print(f"\n{Fore.WHITE}{i}. {Fore.YELLOW}{clean_title}")
-            print(f"   📁 Pfad: {video['folder_structure']}")
-            print(f"   📊 Größe: {video['file_size_mb']} MB")
-            print(f"   📅 Aufnahme: {video['record_date'].strftime('%d.%m.%Y - %H:%M Uhr')}")
+            append(f"\n{Fore.WHITE}{i}. {Fore.YELLOW}{clean_title}")
+            append(f"   📁 Pfad: {video['folder_structure']}")
+            append(f"   📊 Größe: {video['file_size'] / (1024 * 1024):.2f} MB")
+            append(f"   📅 Aufnahme: {video['record_date_str']}")
             
             # Playlist-Analyse
             playlist_info = video['playlist_info']
-            print(f"\n{Fore.BLUE}🔍 Playlist-Analyse für '{clean_title}':")
-            print(f"   - Hauptordner: {playlist_info['main_folder']}")
+            append(f"\n{Fore.BLUE}🔍 Playlist-Analyse für '{clean_title}':")
+            append(f"   - Hauptordner: {playlist_info['main_folder']}")
             if playlist_info['game_folder']:
-                print(f"   - Spielordner: {playlist_info['game_folder']}")
+                append(f"   - Spielordner: {playlist_info['game_folder']}")
             if playlist_info['sub_folders']:
-                print(f"   - Alle Unterordner: {playlist_info['sub_folders']}")
+                append(f"   - Alle Unterordner: {list(playlist_info['sub_folders'])}")
             else:
-                print(f"   - Alle Unterordner: [keine]")
-            print(f"   - Potentielle Playlists: {playlist_info['potential_playlists']}")
-            print(f"   - {Fore.GREEN}PRIMÄRE Playlist (für Upload): {playlist_info['primary_playlist']}")
+                append(f"   - Alle Unterordner: [keine]")
+            append(f"   - Potentielle Playlists: {list(playlist_info['potential_playlists'])}")
+            append(f"   - {Fore.GREEN}PRIMÄRE Playlist (für Upload): {playlist_info['primary_playlist']}")
             if playlist_info['additional_playlists']:
-                print(f"   - {Fore.CYAN}ZUSÄTZLICHE Playlists: {playlist_info['additional_playlists']}")
+                append(f"   - {Fore.CYAN}ZUSÄTZLICHE Playlists: {list(playlist_info['additional_playlists'])}")
             
-            print(f"{Fore.CYAN}{'-'*50}")
+            append(f"{Fore.CYAN}{'-'*50}")
+        
+        self._print_lines(lines)
         
         # Zeige Quota-Information
         self._print_quota_info(len(videos))
     
-    def upload_videos(self, videos: List[Dict]) -> bool:
+    def upload_videos(self, videos: List[VideoInfo]) -> bool:
         """Lädt alle Videos zu YouTube hoch"""
         if not videos:
             print(f"{Fore.YELLOW}📭 Keine Videos zum Upload gefunden.")
@@ -763,96 +1409,385 @@ class YouTubeUploader:
             print(f"{Fore.YELLOW}⏹️  Upload abgebrochen durch Benutzer.")
             return False
         
-        success_count = 0
+        # Mit Tagesbudget: Quota vorab in Upload-Reihenfolge reservieren, was nicht mehr passt wird verschoben
+        reservations = self._reserve_upload_quota(videos)
+        scheduled = [(video, reservation) for video, reservation in zip(videos, reservations) if reservation is not None]
+        self.stats['deferred_uploads'] = len(videos) - len(scheduled)
         
-        for i, video in enumerate(videos, 1):
-            clean_title = self._clean_title_for_display(video['title'])
-            print(f"\n{Fore.CYAN}{'='*70}")
-            print(f"{Fore.CYAN}📤 Upload {i}/{len(videos)}: {clean_title}")
-            print(f"{Fore.CYAN}{'='*70}")
-            
-            try:
-                # Upload das Video
-                video_id = self._upload_single_video(video)
-                
-                if video_id:
-                    # Füge zu Playlist hinzu
-                    self._add_to_playlist(video_id, video)
-                    
-                    # Benenne Datei um
-                    self._rename_uploaded_file(video)
-                    
+        # Fehlende Playlists der eingeplanten Videos vorab gesammelt erstellen
+        self._create_missing_playlists([video for video, _ in scheduled])
+        
+        success_count = 0
+        total_count = len(scheduled)
+        if not total_count:
+            self._print_upload_summary(success_count, len(videos))
+            return False
+        workers = min(self.max_concurrent_uploads, total_count)
+        
+        # Parallele Uploads teilen sich einen Gesamtbalken statt je einen eigenen (weniger Neuzeichnen)
+        shared_progress = None
+        if workers > 1:
+            shared_progress = _SharedProgress(tqdm(
+                total=sum(video['file_size'] for video, _ in scheduled),
+                desc="📤 Gesamt",
+                unit="B",
+                unit_scale=True,
+                unit_divisor=1024,
+                colour='green',
+                dynamic_ncols=True,
+                file=sys.stdout,
+                disable=None,  # Ohne Terminal (Log-Datei, Pipe) kein Balken
+                mininterval=0.5,
+                smoothing=0.1
+            ))
+        
+        executor = _DaemonThreadPool(max_workers=workers)
+        futures = [
+            executor.submit(self._process_video, video, i, total_count, shared_progress, reservation)
+            for i, (video, reservation) in enumerate(scheduled, 1)
+        ]
+        try:
+            for future in as_completed(futures):
+                if future.result():
                     success_count += 1
                     self.stats['uploaded_videos'] += 1
-                    
-                    print(f"{Fore.GREEN}✅ '{clean_title}' erfolgreich als {self.default_visibility.upper()} hochgeladen!")
-                    
                 else:
                     self.stats['failed_uploads'] += 1
-                    print(f"{Fore.RED}❌ Upload fehlgeschlagen für: {clean_title}")
-                
-                # Pause zwischen Uploads
-                if i < len(videos):
-                    print(f"{Fore.YELLOW}⏳ Warte 10 Sekunden vor nächstem Upload...")
-                    time.sleep(10)
-                    
-            except Exception as e:
-                self.stats['failed_uploads'] += 1
-                print(f"{Fore.RED}❌ Fehler beim Upload von '{clean_title}': {str(e)}")
+        except KeyboardInterrupt:
+            # Nicht auf laufende Requests warten: die Upload-Sessions sind gespeichert und werden beim
+            # nächsten Start fortgesetzt, die Daemon-Threads enden mit dem Programm
+            self._abort_uploads.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            tqdm.write(f"\n{Fore.YELLOW}⏸️  Uploads angehalten (werden beim nächsten Start fortgesetzt)")
+            raise
+        else:
+            executor.shutdown(wait=True)
+        finally:
+            if shared_progress is not None:
+                shared_progress.close()
                 
         # Upload-Zusammenfassung
         self._print_upload_summary(success_count, len(videos))
         
         return success_count > 0
     
-    def _upload_single_video(self, video: Dict) -> Optional[str]:
-        """Lädt ein einzelnes Video zu YouTube hoch"""
+    def _process_video(self, video: VideoInfo, index: int, total_count: int,
+                       shared_progress: Optional[_SharedProgress] = None,
+                       quota_reservation: Tuple[int, int] = (0, 0)) -> bool:
+        """Lädt ein Video hoch, ordnet es den Playlists zu und benennt die Datei um (läuft im Upload-Thread)"""
+        clean_title = self._clean_title_for_display(video['title'])
+        
+        # Abstand zwischen Upload-Starts einhalten
+        self._wait_for_upload_slot()
+        
+        # Als ein Block schreiben, damit parallele Uploads ihn nicht zerteilen
+        tqdm.write(f"\n{Fore.CYAN}{'='*70}{Style.RESET_ALL}\n"
+                   f"{Fore.CYAN}📤 Upload {index}/{total_count}: {clean_title}{Style.RESET_ALL}\n"
+                   f"{Fore.CYAN}{'='*70}")
+        
         try:
-            # Erstelle Video-Metadaten
-            body = self._create_video_metadata(video)
+            # Upload das Video
+            video_id = self._upload_single_video(video, shared_progress)
             
-            # Erstelle Media Upload mit kleineren Chunks für bessere Progress-Updates
-            chunk_size = 1024 * 1024 * 5  # 5MB Chunks für regelmäßigere Updates
-            media = MediaFileUpload(
-                video['file_path'],
-                chunksize=chunk_size,
-                resumable=True,
-                mimetype='video/*'
-            )
+            if video_id:
+                # Füge zu Playlist hinzu
+                self._add_to_playlist(video_id, video)
+                
+                # Benenne Datei um
+                self._rename_uploaded_file(video)
+                
+                tqdm.write(f"{Fore.GREEN}✅ '{clean_title}' erfolgreich als {self.default_visibility.upper()} hochgeladen!")
+                return True
             
-            # Starte Upload-Request
-            request = self.youtube_service.videos().insert(
-                part=','.join(body.keys()),
-                body=body,
-                media_body=media
-            )
+            # Video wurde nicht angenommen: reservierte Quota wieder freigeben
+            self._release_upload_quota(video, quota_reservation)
+            
+            if not self._abort_uploads.is_set():
+                tqdm.write(f"{Fore.RED}❌ Upload fehlgeschlagen für: {clean_title}")
+            return False
+                
+        except Exception as e:
+            tqdm.write(f"{Fore.RED}❌ Fehler beim Upload von '{clean_title}': {str(e)}")
+            return False
+    
+    def _wait_for_upload_slot(self):
+        """Wartet, bis seit dem letzten Upload-Start der aktuelle adaptive Abstand vergangen ist"""
+        with self._pacing_lock:
+            now = time.monotonic()
+            wait = self._next_upload_start - now
+            self._next_upload_start = max(now, self._next_upload_start) + self._upload_delay
+        
+        if wait > 0:
+            if wait >= 1:
+                tqdm.write(f"{Fore.YELLOW}⏳ Warte {wait:.0f} Sekunden vor nächstem Upload...")
+            time.sleep(wait)
+    
+    def _record_upload_success(self):
+        """Verringert den Upload-Abstand additiv nach einem Upload ohne Wiederholungen"""
+        with self._pacing_lock:
+            self._upload_delay = max(0.0, self._upload_delay - self.UPLOAD_DELAY_STEP)
+    
+    def _record_upload_throttled(self, retry_after: Optional[float] = None):
+        """Vergrößert den Upload-Abstand multiplikativ, wenn die API drosselt"""
+        with self._pacing_lock:
+            delay = max(self.UPLOAD_DELAY_STEP, self._upload_delay * 2, retry_after or 0)
+            self._upload_delay = min(self.UPLOAD_DELAY_MAX, delay)
+    
+    @staticmethod
+    def _stdout_is_utf8() -> bool:
+        """Prüft, ob die Konsole UTF-8 ausgibt (dann bleiben Umlaute im Progress-Bar-Titel erhalten)"""
+        encoding = getattr(sys.stdout, 'encoding', None) or ''
+        return encoding.lower().replace('-', '') == 'utf8'
+    
+    @staticmethod
+    def _get_retry_after(error: googleapiclient.errors.HttpError) -> Optional[float]:
+        """Liest den Retry-After-Header (in Sekunden) einer API-Fehlerantwort, falls vorhanden"""
+        try:
+            return float(error.resp.get('retry-after'))
+        except (AttributeError, TypeError, ValueError):
+            return None
+    
+    def _next_backoff(self, previous: float, retry_after: Optional[float] = None) -> float:
+        """Nächste Wartezeit vor einer Wiederholung (Decorrelated Jitter, mindestens Retry-After)"""
+        delay = min(self.RETRY_MAX_DELAY, random.uniform(self.RETRY_BASE_DELAY, previous * 3))
+        return max(delay, retry_after or 0)
+    
+    @staticmethod
+    def _get_error_reason(error: googleapiclient.errors.HttpError) -> Optional[str]:
+        """Liest den ersten Fehlergrund (z.B. 'quotaExceeded') aus dem JSON-Body einer API-Fehlerantwort"""
+        try:
+            content = error.content
+            if isinstance(content, bytes):
+                content = content.decode('utf-8')
+            errors = json.loads(content)['error'].get('errors') or []
+            return errors[0].get('reason') if errors else None
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+            return None
+    
+    def _get_resume_entry(self, file_path: str, file_size: int, mtime: float) -> Optional[Dict]:
+        """Liefert die gespeicherte Upload-Session einer Datei, sofern sich die Datei nicht geändert hat"""
+        with self._resume_lock:
+            if self._resume_state is None:
+                try:
+                    with open(self.RESUME_FILE, 'r', encoding='utf-8') as f:
+                        self._resume_state = json.load(f)
+                except (OSError, ValueError):
+                    self._resume_state = {}
+            entry = self._resume_state.get(file_path)
+        if entry and entry.get('size') == file_size and entry.get('mtime') == mtime:
+            return entry
+        return None
+    
+    def _set_resume_entry(self, file_path: str, entry: Optional[Dict]):
+        """Speichert (oder entfernt bei None) die Upload-Session einer Datei"""
+        with self._resume_lock:
+            if self._resume_state is None:
+                self._resume_state = {}
+            if entry is None:
+                if self._resume_state.pop(file_path, None) is None:
+                    return
+            else:
+                self._resume_state[file_path] = entry
+            try:
+                os.makedirs(self.CONFIG_DIR, exist_ok=True)
+                # Atomar ersetzen, damit ein Abbruch keine halbe Datei hinterlässt
+                tmp_path = self.RESUME_FILE + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._resume_state, f)
+                os.replace(tmp_path, self.RESUME_FILE)
+            except OSError as e:
+                if self.debug_mode:
+                    tqdm.write(f"{Fore.YELLOW}⚠️  Upload-Stand konnte nicht gespeichert werden: {str(e)}")
+    
+    @classmethod
+    def _quota_day(cls) -> str:
+        """Aktueller Quota-Tag (die API setzt die Quota um Mitternacht pazifischer Zeit zurück)"""
+        try:
+            from datetime import datetime
+            from zoneinfo import ZoneInfo
+            return datetime.now(ZoneInfo(cls.QUOTA_TIMEZONE)).strftime('%Y-%m-%d')
+        except Exception:
+            # Ohne zoneinfo/tzdata (Python < 3.9, Windows ohne tzdata): US-Sommerzeitregel selbst anwenden
+            now = time.time()
+            year = time.gmtime(now).tm_year
+            # Sommerzeit (UTC-7) vom 2. Sonntag im März 10:00 UTC bis zum 1. Sonntag im November 09:00 UTC
+            dst_start = calendar.timegm((year, 3, 8 + (6 - calendar.weekday(year, 3, 1)) % 7, 10, 0, 0))
+            dst_end = calendar.timegm((year, 11, 1 + (6 - calendar.weekday(year, 11, 1)) % 7, 9, 0, 0))
+            offset_hours = 7 if dst_start <= now < dst_end else 8
+            return time.strftime('%Y-%m-%d', time.gmtime(now - offset_hours * 60 * 60))
+    
+    def _get_quota_state_locked(self) -> Dict:
+        """Liefert den Quota-Zähler des aktuellen Tages (beim ersten Zugriff aus der Datei gelesen)"""
+        if self._quota_state is None:
+            try:
+                with open(self.QUOTA_FILE, 'r', encoding='utf-8') as f:
+                    self._quota_state = json.load(f)
+            except (OSError, ValueError):
+                self._quota_state = {}
+        day = self._quota_day()
+        state = self._quota_state
+        if not isinstance(state, dict) or state.get('day') != day or not isinstance(state.get('used'), int):
+            self._quota_state = state = {'day': day, 'used': 0}
+        return state
+    
+    def _save_quota_state_locked(self, state: Dict):
+        """Schreibt den Quota-Zähler atomar (nur mit gehaltenem _quota_lock aufrufen)"""
+        try:
+            os.makedirs(self.CONFIG_DIR, exist_ok=True)
+            tmp_path = self.QUOTA_FILE + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.QUOTA_FILE)
+        except OSError as e:
+            if self.debug_mode:
+                tqdm.write(f"{Fore.YELLOW}⚠️  Quota-Zähler konnte nicht gespeichert werden: {str(e)}")
+    
+    def _charge_quota(self, units: int, reserve: bool = False) -> bool:
+        """Bucht Quota-Punkte im lokalen Zähler (reserve=True: nur wenn das Tagesbudget dafür reicht, negativ = freigeben)"""
+        if not self._quota_limit:
+            return True
+        with self._quota_lock:
+            state = self._get_quota_state_locked()
+            if reserve and (state.get('exhausted') or state['used'] + units > self._quota_limit):
+                return False
+            state['used'] = max(0, state['used'] + units)
+            self._save_quota_state_locked(state)
+        return True
+    
+    def _exhaust_quota(self):
+        """Sperrt das Tagesbudget, nachdem die API quotaExceeded gemeldet hat (bis zum nächsten Quota-Tag)"""
+        if not self._quota_limit:
+            return
+        with self._quota_lock:
+            state = self._get_quota_state_locked()
+            state['used'] = max(state['used'], self._quota_limit)
+            state['exhausted'] = True
+            self._save_quota_state_locked(state)
+    
+    def _has_resume_session(self, video: VideoInfo) -> bool:
+        """Prüft, ob für die (unveränderte) Datei eine gespeicherte Upload-Session existiert"""
+        try:
+            mtime = os.stat(video['file_path']).st_mtime
+        except OSError:
+            return False
+        return self._get_resume_entry(video['file_path'], video['file_size'], mtime) is not None
+    
+    def _reserve_upload_quota(self, videos: List[VideoInfo]) -> List[Optional[Tuple[int, int]]]:
+        """Reserviert in Upload-Reihenfolge die Quota je Video (None = verschoben, sonst freigebbare Anteile)"""
+        if not self._quota_limit:
+            return [(0, 0)] * len(videos)
+        
+        reservations = []
+        deferred_lines = []
+        planned_playlists = set()
+        for video in videos:
+            potential_playlists = video['playlist_info']['potential_playlists']
+            new_playlists = {self._playlist_key(name) for name in potential_playlists}
+            new_playlists -= planned_playlists
+            new_playlists.difference_update(self.playlist_cache)
+            
+            # Playlist-Zuordnungen, neue Playlists und der Upload-Start (nicht bei fortgesetzter Session,
+            # deren Start bereits im Lauf davor gebucht wurde)
+            items_cost = self.QUOTA_COSTS['playlist_item'] * len(potential_playlists)
+            upload_cost = 0 if self._has_resume_session(video) else self.QUOTA_COSTS['upload']
+            cost = items_cost + upload_cost + self.QUOTA_COSTS['playlist_insert'] * len(new_playlists)
+            
+            if self._charge_quota(cost, reserve=True):
+                planned_playlists |= new_playlists
+                self._reserved_playlists |= new_playlists
+                reservations.append((items_cost, upload_cost))
+            else:
+                reservations.append(None)
+                deferred_lines.append(f"{Fore.YELLOW}⏸️  Tages-Quota reicht nicht mehr für "
+                                      f"'{self._clean_title_for_display(video['title'])}' - "
+                                      f"Upload wird auf den nächsten Lauf verschoben")
+        
+        if deferred_lines:
+            self._print_lines(deferred_lines)
+        return reservations
+    
+    def _release_upload_quota(self, video: VideoInfo, reservation: Tuple[int, int]):
+        """Gibt die Reservierung eines nicht angenommenen Videos frei (neue Playlists bleiben gebucht)"""
+        items_cost, upload_cost = reservation
+        # Der Upload-Start bleibt gebucht, solange seine Session gespeichert ist - sie wird im nächsten Lauf
+        # ohne erneute Buchung fortgesetzt
+        if upload_cost and self._has_resume_session(video):
+            upload_cost = 0
+        if items_cost or upload_cost:
+            self._charge_quota(-(items_cost + upload_cost))
+    
+    @classmethod
+    def _parse_daily_quota(cls, value: Optional[str]) -> int:
+        """Wandelt DAILY_QUOTA in das Tagesbudget des lokalen Quota-Zählers um (0 = keine Prüfung)"""
+        if not value:
+            return cls.DAILY_QUOTA
+        try:
+            return max(0, int(value))
+        except ValueError:
+            print(f"{Fore.YELLOW}⚠️  Ungültiger Wert für DAILY_QUOTA ignoriert: {value}")
+            return cls.DAILY_QUOTA
+    
+    @classmethod
+    def _parse_upload_chunk_mb(cls, value: Optional[str]) -> Optional[int]:
+        """Wandelt UPLOAD_CHUNK_MB in eine gültige Chunk-Größe in Bytes um (None = automatisch)"""
+        if not value:
+            return None
+        try:
+            chunk_size = int(float(value) * 1024 * 1024)
+        except ValueError:
+            print(f"{Fore.YELLOW}⚠️  Ungültiger Wert für UPLOAD_CHUNK_MB ignoriert: {value}")
+            return None
+        # Mindestens ein und immer ein Vielfaches von 256 KB (Vorgabe der API)
+        return max(cls.UPLOAD_CHUNK_ALIGN, chunk_size - chunk_size % cls.UPLOAD_CHUNK_ALIGN)
+    
+    def _upload_chunk_size(self, file_size: int) -> int:
+        """Bestimmt die Chunk-Größe für den Upload (nie -1: bei Streams wären Content-Ranges von Retries falsch)"""
+        if self._upload_chunk_override is not None:
+            return self._upload_chunk_override
+        chunk_size = max(self.UPLOAD_CHUNK_MIN, min(self.UPLOAD_CHUNK_MAX, file_size // 20))
+        return chunk_size - chunk_size % self.UPLOAD_CHUNK_ALIGN
+    
+    def _upload_single_video(self, video: VideoInfo,
+                             shared_progress: Optional[_SharedProgress] = None) -> Optional[str]:
+        """Lädt ein einzelnes Video zu YouTube hoch (mit shared_progress: Fortschritt im Gesamtbalken)"""
+        from googleapiclient.http import MediaIoBaseUpload
+        
+        progress_view = None
+        try:
+            # Erstelle Video-Metadaten
+            body = self._create_video_metadata(video)
             
             # Upload mit verbesserter Progress Bar
             response = None
             retry = 0
+            backoff = self.RETRY_BASE_DELAY
             
             # Erstelle Progress Bar basierend auf Dateigröße
             file_size_bytes = video['file_size']
-            file_size_mb = video['file_size_mb']
             
             clean_title = self._clean_title_for_display(video['title'])
-            print(f"{Fore.BLUE}📤 Starte Upload: {clean_title} ({file_size_mb:.1f} MB)")
+            tqdm.write(f"{Fore.BLUE}📤 Starte Upload: {clean_title} ({file_size_bytes / (1024 * 1024):.1f} MB)")
             
-            # Bereinige Titel für Progress Bar (entferne problematische Unicode-Zeichen)
+            # Bereinige Titel für Progress Bar (ohne '?', nur ASCII falls das Terminal kein UTF-8 kann)
             progress_title = clean_title
             
             # Entferne Unicode-Escape-Sequenzen
-            import re
-            progress_title = re.sub(r'\\udc[0-9a-fA-F]{2}', '', progress_title)
-            
-            # Fallback auf ASCII mit Replacement für saubere Darstellung
-            progress_title = progress_title.encode('ascii', errors='replace').decode('ascii')
+            if '\\' in progress_title:
+                progress_title = self._ESCAPED_SURROGATE_RE.sub('', progress_title)
             
-            # Entferne Replacement-Character
-            progress_title = progress_title.replace('?', '').strip()
+            if self._stdout_is_utf8():
+                progress_title = progress_title.replace('?', '')
+            else:
+                # Nicht-ASCII-Zeichen und '?' in einem Durchlauf entfernen
+                progress_title = progress_title.translate(self._PROGRESS_STRIP_TABLE)
+                if not progress_title.isascii():
+                    # Nur falls der Originaltitel ungefiltert durchgereicht wurde
+                    progress_title = progress_title.encode('ascii', errors='ignore').decode('ascii')
+            progress_title = progress_title.strip()
             
             # Dynamische Terminal-Breite für bessere Darstellung
-            import shutil
             terminal_width = shutil.get_terminal_size().columns
             
             # Passe Progress Bar an Terminal-Breite an
@@ -867,7 +1802,11 @@ class YouTubeUploader:
                 bar_format = "{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]"
                 use_ncols = min(terminal_width - 10, 120)  # Maximal 120 Zeichen
             
-            with tqdm(
+            if shared_progress is not None:
+                progress_view = _SharedProgressView(shared_progress)
+            
+            # Eigener Balken nur bei seriellen Uploads (erst nach erfolgreichem Öffnen der Datei erzeugt)
+            with open(video['file_path'], 'rb') as video_file, progress_view or tqdm(
                 total=file_size_bytes,
                 desc=desc_text,
                 unit="B",
@@ -876,68 +1815,94 @@ class YouTubeUploader:
                 bar_format=bar_format,
                 colour='green',
                 ncols=use_ncols,
-                leave=True,
                 dynamic_ncols=True,  # Wichtig: True für responsive Verhalten
                 file=sys.stdout,
                 ascii=False,
-                miniters=1,  # Update bei jedem Chunk
+                disable=None,  # Ohne Terminal (Log-Datei, Pipe) kein Balken, nur die Statuszeilen
+                miniters=1,  # Update bei jedem gesendeten Block
                 mininterval=0.5  # Aber nicht öfter als alle 0.5 Sekunden
             ) as pbar:
                 
-                last_uploaded_bytes = 0
-                last_progress_percent = 0
+                # Fortschritt kommt direkt aus den gelesenen Bytes, nicht aus den Chunk-Antworten
+                media = MediaIoBaseUpload(
+                    _ProgressReader(video_file, pbar.update),
+                    mimetype='video/*',
+                    chunksize=self._upload_chunk_size(file_size_bytes),
+                    resumable=True
+                )
+                
+                # Starte Upload-Request
+                request = self._get_service().videos().insert(
+                    part=self._INSERT_PART,
+                    body=body,
+                    media_body=media
+                )
+                
+                # Abgebrochene Session fortsetzen (nur wenn die Datei unverändert ist)
+                file_path = video['file_path']
+                file_mtime = os.fstat(video_file.fileno()).st_mtime
+                resume_entry = self._get_resume_entry(file_path, file_size_bytes, file_mtime)
+                if resume_entry:
+                    request.resumable_uri = resume_entry['uri']
+                    request.resumable_progress = resume_entry['progress']
+                    tqdm.write(f"{Fore.CYAN}⏯️  Setze Upload bei {resume_entry['progress'] / (1024 * 1024):.1f} MB fort")
+                
+                # Nur der Start des Uploads zählt als API-Aufruf, nicht die einzelnen Chunks
+                self._throttle_api()
                 
                 while response is None:
+                    if self._abort_uploads.is_set():
+                        pbar.write(f"{Fore.YELLOW}⏸️  Upload angehalten: {clean_title}")
+                        return None
+                    
                     try:
                         status, response = request.next_chunk()
                         
                         if status:
-                            # Berechne hochgeladene Bytes basierend auf Progress
-                            uploaded_bytes = int(status.progress() * file_size_bytes)
-                            progress_percent = status.progress() * 100
-                            
-                            # Update Progress Bar mit Delta (nur bei nennenswerten Änderungen)
-                            bytes_increment = uploaded_bytes - last_uploaded_bytes
-                            progress_increment = progress_percent - last_progress_percent
-                            
-                            if bytes_increment > 0:
-                                pbar.update(bytes_increment)
-                                last_uploaded_bytes = uploaded_bytes
-                            
-                            # Update Progress Info nur bei größeren Schritten (mindestens 2% Unterschied für weniger Updates)
-                            if progress_increment >= 2.0 or response:
-                                if terminal_width < 80:
-                                    # Schmales Terminal: Nur Prozent
-                                    pbar.set_postfix({
-                                        'Retry': retry if retry > 0 else None
-                                    }, refresh=False)
-                                else:
-                                    # Breites Terminal: Vollständige Info
-                                    pbar.set_postfix({
-                                        'Prozent': f'{progress_percent:.1f}%',
-                                        'Retry': retry if retry > 0 else None
-                                    }, refresh=False)
-                                last_progress_percent = progress_percent
+                            # Bestätigten Stand sichern, um nach einem Abbruch fortsetzen zu können
+                            self._set_resume_entry(file_path, {
+                                'uri': request.resumable_uri,
+                                'progress': status.resumable_progress,
+                                'size': file_size_bytes,
+                                'mtime': file_mtime,
+                            })
+                            # Der Balken selbst wird über die gelesenen Bytes (_ProgressReader) aktualisiert
+                            # (bar_format enthält kein {postfix}, daher keine Zusatzinfos pro Chunk)
                                 
                         elif response:
                             # Upload complete - fülle die Bar auf
-                            remaining_bytes = file_size_bytes - last_uploaded_bytes
+                            remaining_bytes = file_size_bytes - pbar.n
                             if remaining_bytes > 0:
                                 pbar.update(remaining_bytes)
-                            pbar.set_postfix({'Status': '✅ Abgeschlossen'}, refresh=True)
                             pbar.refresh()  # Finale Aktualisierung
                             
                     except googleapiclient.errors.HttpError as e:
-                        if e.resp.status in [500, 502, 503, 504]:
-                            # Retriable errors
+                        if resume_entry and e.resp.status in (404, 410):
+                            # Gespeicherte Session abgelaufen - Upload neu beginnen
+                            resume_entry = None
+                            self._set_resume_entry(file_path, None)
+                            request.resumable_uri = None
+                            request.resumable_progress = 0
+                            pbar.write(f"{Fore.YELLOW}⚠️  Gespeicherte Upload-Session abgelaufen, starte neu")
+                            continue
+                        
+                        action = self.UPLOAD_ERROR_ACTIONS.get(self._get_error_reason(e))
+                        if action == 'retry' or (action is None and e.resp.status in self.UPLOAD_RETRY_STATUS):
+                            # Retriable errors (inkl. Rate-Limit)
+                            retry_after = self._get_retry_after(e)
+                            self._record_upload_throttled(retry_after)
                             retry += 1
-                            if retry > 3:
+                            if retry > self.UPLOAD_MAX_RETRIES:
                                 pbar.write(f"{Fore.RED}❌ Zu viele Wiederholungsversuche")
                                 raise e
-                            pbar.write(f"{Fore.YELLOW}⚠️  Retriable error {e.resp.status}, retry {retry}/3")
-                            time.sleep(2 ** retry)
-                        elif e.resp.status == 403 and 'quotaExceeded' in str(e):
-                            # Quota exceeded - spezielle Behandlung
+                            backoff = self._next_backoff(backoff, retry_after)
+                            pbar.write(f"{Fore.YELLOW}⚠️  Retriable error {e.resp.status}, "
+                                       f"retry {retry}/{self.UPLOAD_MAX_RETRIES} in {backoff:.1f}s")
+                            time.sleep(backoff)
+                        elif action == 'quota':
+                            # Quota exceeded - spezielle Behandlung, weitere Uploads werden zurückgestellt
+                            self._record_upload_throttled()
+                            self._exhaust_quota()
                             pbar.write(f"{Fore.RED}❌ YOUTUBE DATA API QUOTA ÜBERSCHRITTEN!")
                             pbar.write(f"{Fore.YELLOW}💡 Quota wird täglich um ~9:00 Uhr deutscher Zeit zurückgesetzt")
                             pbar.write(f"{Fore.YELLOW}🔧 Oder beantragen Sie eine Quota-Erhöhung in der Google Cloud Console")
@@ -946,18 +1911,27 @@ class YouTubeUploader:
                             pbar.write(f"{Fore.RED}❌ HTTP Error: {e}")
                             raise e
             
+            self._set_resume_entry(file_path, None)
+            
             if 'id' in response:
-                print(f"{Fore.GREEN}✅ Upload erfolgreich! Video-ID: {response['id']}")
+                if retry == 0:
+                    self._record_upload_success()
+                progress_view = None  # Anteil bleibt im Gesamtbalken
+                tqdm.write(f"{Fore.GREEN}✅ Upload erfolgreich! Video-ID: {response['id']}")
                 return response['id']
             else:
-                print(f"{Fore.RED}❌ Upload fehlgeschlagen: {response}")
+                tqdm.write(f"{Fore.RED}❌ Upload fehlgeschlagen: {response}")
                 return None
                 
         except Exception as e:
-            print(f"{Fore.RED}❌ Fehler beim Video-Upload: {str(e)}")
+            tqdm.write(f"{Fore.RED}❌ Fehler beim Video-Upload: {str(e)}")
             return None
+        finally:
+            # Abgebrochene oder fehlgeschlagene Uploads nicht als Fortschritt stehen lassen
+            if progress_view is not None:
+                shared_progress.discard(progress_view.n, video['file_size'])
     
-    def _create_video_metadata(self, video: Dict) -> Dict:
+    def _create_video_metadata(self, video: VideoInfo) -> Dict:
         """Erstellt Metadaten für YouTube-Video"""
         # Verwende den bereinigten Titel für YouTube
         clean_title = self._clean_title_for_display(video['title'])
@@ -978,98 +1952,56 @@ class YouTubeUploader:
                 'defaultLanguage': 'de',
                 'defaultAudioLanguage': 'de'
             },
-            'status': {
-                'privacyStatus': self.default_visibility,
-                'selfDeclaredMadeForKids': False,  # Explizit NICHT für Kinder
-                'embeddable': True,
-                'license': 'youtube',
-                'publicStatsViewable': True
-            }
+            'status': {'privacyStatus': self.default_visibility, **self._VIDEO_STATUS}
         }
         
         return body
     
-    def _generate_description(self, video: Dict, clean_title: Optional[str] = None) -> str:
+    def _generate_description(self, video: VideoInfo, clean_title: Optional[str] = None) -> str:
         """Generiert automatische Beschreibung für das Video"""
         # Verwende bereinigten Titel falls verfügbar, sonst Original
         title_for_description = clean_title if clean_title else self._clean_title_for_display(video['title'])
         
         # Unterschiedliche Beschreibung je nach Video-Typ
-        if video['video_type'] == 'onlymic':
-            description_parts = [
-                f"Mikrofon Audio: {title_for_description}",
-                "Nur Mikrofon-Aufnahme ohne Desktop-Audio",
-                ""
-            ]
-        elif video['video_type'] == 'onlydesktop':
-            description_parts = [
-                f"Game/Desktop Audio: {title_for_description}",
-                "Nur Game-/Desktop-Audio ohne Mikrofon",
-                ""
-            ]
-        else:
-            description_parts = [
-                f"Gameplay Video: {title_for_description}",
-                ""
-            ]
+        label, *details = self._DESCRIPTION_INTRO_BY_TYPE.get(video['video_type'], self._DEFAULT_DESCRIPTION_INTRO)
+        description_parts = [f"{label}{title_for_description}", *details, ""]
+        
+        playlist_info = video['playlist_info']
+        main_folder = playlist_info['main_folder']
         
         # Spiel-Information hinzufügen
-        if video['playlist_info']['game_folder']:
-            description_parts.append(f"Spiel: {video['playlist_info']['game_folder']}")
-        
-        # Kategorie hinzufügen (Unterordner)
-        if video['playlist_info']['sub_folders']:
-            category = video['playlist_info']['sub_folders'][-1]  # Letzter/spezifischster Unterordner
-            description_parts.append(f"Kategorie: {category}")
-        
-        # Video-Status hinzufügen
-        if video['video_type'] == 'merged':
-            description_parts.append("Status: Sound erfolgreich gemerged")
-        elif video['video_type'] == 'onlymic':
-            description_parts.append("Status: Nur Mikrofon-Audio extrahiert")
-        elif video['video_type'] == 'onlydesktop':
-            description_parts.append("Status: Nur Game/Desktop-Audio extrahiert")
-        else:  # unmergable
-            description_parts.append("Status: Sound war nicht mergbar (Original-Audio)")
-        
-        # Aufnahmedatum
-        record_date_str = video['record_date'].strftime('%d.%m.%Y - %H:%M Uhr')
-        description_parts.append(f"Aufgenommen am: {record_date_str}")
-        
-        description_parts.append("")
-        
-        # Sammlung
-        main_folder = video['playlist_info']['main_folder']
-        description_parts.append(f'Automatisch hochgeladen aus der Sammlung "{main_folder}"')
+        if playlist_info['game_folder']:
+            description_parts.append(f"Spiel: {playlist_info['game_folder']}")
+        
+        # Kategorie hinzufügen (letzter/spezifischster Unterordner)
+        if playlist_info['sub_folders']:
+            description_parts.append(f"Kategorie: {playlist_info['sub_folders'][-1]}")
+        
+        # Video-Status, Aufnahmedatum und Sammlung
+        description_parts += (
+            self._STATUS_BY_TYPE.get(video['video_type'], self._STATUS_BY_TYPE['unmergable']),
+            f"Aufgenommen am: {video['record_date_str']}",
+            "",
+            f'Automatisch hochgeladen aus der Sammlung "{main_folder}"',
+        )
         
         return '\n'.join(description_parts)
     
-    def _generate_tags(self, video: Dict) -> List[str]:
+    def _generate_tags(self, video: VideoInfo) -> List[str]:
         """Generiert Tags für das Video"""
-        # Grundlegende Tags je nach Video-Typ
-        if video['video_type'] == 'onlymic':
-            tags = ['Audio', 'Mikrofon', 'Mic Only', 'Voice', 'Deutsch']
-        elif video['video_type'] == 'onlydesktop':
-            tags = ['Audio', 'Game Audio', 'Desktop Audio', 'Sound Effects', 'Gaming']
-        else:
-            tags = ['Gaming', 'Gameplay', 'Deutsch', "Let's Play"]
+        playlist_info = video['playlist_info']
         
-        # Spiel-Name als Tag
-        if video['playlist_info']['game_folder']:
-            tags.append(video['playlist_info']['game_folder'])
-        
-        # Haupt-Ordner als Tag
-        main_folder = video['playlist_info']['main_folder']
-        if main_folder:
-            tags.append(main_folder.replace(' ', ''))
-        
-        # Sub-Ordner als Tags
-        for sub_folder in video['playlist_info']['sub_folders']:
-            tags.append(sub_folder)
+        # Typ-Tags, Spiel-Name, Haupt-Ordner (ohne Leerzeichen) und Sub-Ordner
+        tags = [*self._TAGS_BY_TYPE.get(video['video_type'], self._DEFAULT_TAGS)]
+        if playlist_info['game_folder']:
+            tags.append(playlist_info['game_folder'])
+        if playlist_info['main_folder']:
+            tags.append(playlist_info['main_folder'].replace(' ', ''))
+        tags += playlist_info['sub_folders']
         
         return tags
     
-    def _add_to_playlist(self, video_id: str, video: Dict):
+    def _add_to_playlist(self, video_id: str, video: VideoInfo):
         """Fügt Video zu allen entsprechenden Playlists hinzu (hierarchisch)"""
         try:
             playlist_info = video['playlist_info']
@@ -1077,169 +2009,301 @@ class YouTubeUploader:
             clean_title = self._clean_title_for_display(video['title'])
             
             if not potential_playlists:
-                print(f"{Fore.YELLOW}⚠️  Keine Playlists für Video '{clean_title}' gefunden")
+                tqdm.write(f"{Fore.YELLOW}⚠️  Keine Playlists für Video '{clean_title}' gefunden")
                 return
             
-            print(f"{Fore.BLUE}📋 Füge Video zu {len(potential_playlists)} Playlist(s) hinzu...")
-            
-            successful_additions = 0
+            tqdm.write(f"{Fore.BLUE}📋 Füge Video zu {len(potential_playlists)} Playlist(s) hinzu...")
             
-            # Füge zu allen potentiellen Playlists hinzu (vom spezifischsten zum allgemeinsten)
+            # Playlist-IDs auflösen (vom spezifischsten zum allgemeinsten, neue Playlists werden erstellt)
+            playlist_ids = {}
             for playlist_name in potential_playlists:
-                try:
-                    playlist_id = self._get_or_create_playlist(playlist_name)
-                    
-                    if playlist_id:
-                        self._add_video_to_playlist(video_id, playlist_id)
-                        print(f"{Fore.GREEN}   ✅ '{playlist_name}' - erfolgreich hinzugefügt")
-                        successful_additions += 1
-                    else:
-                        print(f"{Fore.YELLOW}   ⚠️  '{playlist_name}' - Playlist konnte nicht erstellt werden")
-                        
-                except Exception as playlist_error:
-                    print(f"{Fore.RED}   ❌ '{playlist_name}' - Fehler: {str(playlist_error)}")
+                playlist_id = self._get_or_create_playlist(playlist_name)
+                if playlist_id:
+                    playlist_ids[playlist_name] = playlist_id
+                else:
+                    tqdm.write(f"{Fore.YELLOW}   ⚠️  '{playlist_name}' - Playlist konnte nicht erstellt werden")
+            
+            # Alle Einfügungen für dieses Video in einem Batch-Request senden
+            errors = self._add_video_to_playlists(video_id, playlist_ids)
+            
+            successful_additions = 0
+            for playlist_name in playlist_ids:
+                error = errors.get(playlist_name)
+                if error is None:
+                    tqdm.write(f"{Fore.GREEN}   ✅ '{playlist_name}' - erfolgreich hinzugefügt")
+                    successful_additions += 1
+                else:
+                    tqdm.write(f"{Fore.RED}   ❌ '{playlist_name}' - Fehler: {str(error)}")
             
             if successful_additions > 0:
-                print(f"{Fore.GREEN}📋 Video erfolgreich zu {successful_additions}/{len(potential_playlists)} Playlist(s) hinzugefügt")
+                tqdm.write(f"{Fore.GREEN}📋 Video erfolgreich zu {successful_additions}/{len(potential_playlists)} Playlist(s) hinzugefügt")
             else:
-                print(f"{Fore.RED}❌ Video konnte zu keiner Playlist hinzugefügt werden")
+                tqdm.write(f"{Fore.RED}❌ Video konnte zu keiner Playlist hinzugefügt werden")
                 
         except Exception as e:
             clean_title = self._clean_title_for_display(video.get('title', 'Unbekannt'))
-            print(f"{Fore.YELLOW}⚠️  Warnung: Playlist-Zuordnung für '{clean_title}' fehlgeschlagen: {str(e)}")
+            tqdm.write(f"{Fore.YELLOW}⚠️  Warnung: Playlist-Zuordnung für '{clean_title}' fehlgeschlagen: {str(e)}")
     
     def _get_or_create_playlist(self, playlist_name: str) -> Optional[str]:
         """Holt oder erstellt eine Playlist (mit Cache-Optimierung)"""
+        # Serialisiert, damit parallele Uploads dieselbe Playlist nicht doppelt erstellen
+        with self._playlist_lock:
+            return self._get_or_create_playlist_locked(playlist_name)
+    
+    def _get_or_create_playlist_locked(self, playlist_name: str) -> Optional[str]:
+        """Holt oder erstellt eine Playlist - nur mit gehaltenem _playlist_lock aufrufen"""
         try:
-            # Lade Playlist-Cache einmalig falls noch nicht geschehen
-            self._load_playlist_cache()
+            # Lade Playlist-Cache nur falls noch nicht geschehen (upload_videos lädt ihn bereits vorab)
+            if not self.playlist_cache_loaded:
+                self._load_playlist_cache()
             
             # Prüfe ob Playlist bereits im Cache existiert
-            if playlist_name in self.playlist_cache:
+            playlist_key = self._playlist_key(playlist_name)
+            playlist_id = self.playlist_cache.get(playlist_key)
+            if playlist_id is not None:
                 if self.debug_mode:
-                    print(f"{Fore.GREEN}📋 Playlist '{playlist_name}' aus Cache gefunden")
-                return self.playlist_cache[playlist_name]
+                    tqdm.write(f"{Fore.GREEN}📋 Playlist '{playlist_name}' aus Cache gefunden")
+                return playlist_id
             
             # Erstelle neue Playlist
             if self.debug_mode:
-                print(f"{Fore.CYAN}📋 Erstelle neue Playlist: {playlist_name}")
+                tqdm.write(f"{Fore.CYAN}📋 Erstelle neue Playlist: {playlist_name}")
                 
-            request = self.youtube_service.playlists().insert(
-                part='snippet,status',
-                body={
-                    'snippet': {
-                        'title': playlist_name,
-                        'description': f'Automatisch erstellte Playlist für {playlist_name} Videos',
-                        'defaultLanguage': 'de'
-                    },
-                    'status': {
-                        'privacyStatus': 'unlisted'
-                    }
-                }
+            # Quota einmal pro Playlist (nicht pro Wiederholung) und nur innerhalb des Tagesbudgets buchen -
+            # außer sie ist schon mit den Uploads reserviert (Vorab-Erstellung per Batch fehlgeschlagen)
+            if playlist_key in self._reserved_playlists:
+                self._reserved_playlists.discard(playlist_key)
+            elif not self._charge_quota(self.QUOTA_COSTS['playlist_insert'], reserve=True):
+                tqdm.write(f"{Fore.YELLOW}⏸️  Tages-Quota reicht nicht für die neue Playlist '{playlist_name}'")
+                return None
+            
+            request = self._get_service().playlists().insert(
+                part=self._INSERT_PART,
+                body=self._playlist_body(playlist_name)
             )
             
-            response = request.execute()
+            # Temporäre Fehler (429, 5xx) mit Jitter wiederholen, statt die Zuordnung aufzugeben
+            backoff = self.RETRY_BASE_DELAY
+            for attempt in range(self.PLAYLIST_BATCH_RETRIES + 1):
+                try:
+                    self._throttle_api()
+                    response = request.execute()
+                    break
+                except googleapiclient.errors.HttpError as e:
+                    if attempt == self.PLAYLIST_BATCH_RETRIES or e.resp.status not in self.UPLOAD_RETRY_STATUS:
+                        raise
+                    backoff = self._next_backoff(backoff, self._get_retry_after(e))
+                    if self.debug_mode:
+                        tqdm.write(f"{Fore.YELLOW}⚠️  Playlist '{playlist_name}': Fehler {e.resp.status}, "
+                                   f"neuer Versuch in {backoff:.1f}s")
+                    time.sleep(backoff)
             playlist_id = response['id']
             
-            # Füge neue Playlist zum Cache hinzu
-            self.playlist_cache[playlist_name] = playlist_id
+            # Füge neue Playlist zum Cache hinzu (auch im gespeicherten Cache, damit sie im nächsten Lauf bekannt ist)
+            self.playlist_cache[playlist_key] = playlist_id
+            self._save_playlist_cache()
             
-            print(f"{Fore.CYAN}📋 Neue Playlist erstellt: {playlist_name}")
+            tqdm.write(f"{Fore.CYAN}📋 Neue Playlist erstellt: {playlist_name}")
             
             return playlist_id
             
         except Exception as e:
-            print(f"{Fore.RED}❌ Fehler bei Playlist-Verwaltung: {str(e)}")
+            tqdm.write(f"{Fore.RED}❌ Fehler bei Playlist-Verwaltung: {str(e)}")
             return None
     
-    def _add_video_to_playlist(self, video_id: str, playlist_id: str):
-        """Fügt Video zu einer Playlist hinzu"""
-        try:
-            request = self.youtube_service.playlistItems().insert(
-                part='snippet',
-                body={
-                    'snippet': {
-                        'playlistId': playlist_id,
-                        'resourceId': {
-                            'kind': 'youtube#video',
-                            'videoId': video_id
-                        }
-                    }
-                }
-            )
+    @staticmethod
+    def _playlist_body(playlist_name: str) -> Dict:
+        """Metadaten für eine automatisch erstellte Playlist"""
+        return {
+            'snippet': {
+                'title': playlist_name,
+                'description': f'Automatisch erstellte Playlist für {playlist_name} Videos',
+                'defaultLanguage': 'de'
+            },
+            'status': {
+                'privacyStatus': 'unlisted'
+            }
+        }
+    
+    def _create_missing_playlists(self, videos: List[VideoInfo]):
+        """Erstellt alle noch fehlenden Playlists der Videos per Batch-Request"""
+        with self._playlist_lock:
+            if not self.playlist_cache_loaded:
+                self._load_playlist_cache()
+            
+            # Reihenfolge beibehalten, Duplikate (auch in anderer Schreibweise) entfernen
+            needed = {}
+            for video in videos:
+                for name in video['playlist_info']['potential_playlists']:
+                    key = self._playlist_key(name)
+                    if key not in self.playlist_cache and key not in needed:
+                        needed[key] = name
+            needed = list(needed.values())
+            if not needed:
+                return
             
-            request.execute()
+            service = self._get_service()
+            playlists = service.playlists()
+            created = []
+            
+            def on_response(playlist_name, response, exception):
+                if exception is None:
+                    self._reserved_playlists.discard(self._playlist_key(playlist_name))
+                    self.playlist_cache[self._playlist_key(playlist_name)] = response['id']
+                    created.append(playlist_name)
+                elif self.debug_mode:
+                    print(f"{Fore.YELLOW}⚠️  Playlist '{playlist_name}' konnte vorab nicht erstellt werden: {exception}")
+            
+            # Maximal 50 Teil-Requests pro Batch (API-Limit)
+            for start in range(0, len(needed), self.PLAYLIST_BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=on_response)
+                chunk = needed[start:start + self.PLAYLIST_BATCH_SIZE]
+                for playlist_name in chunk:
+                    batch.add(playlists.insert(
+                        part=self._INSERT_PART,
+                        body=self._playlist_body(playlist_name)
+                    ), request_id=playlist_name)
+                try:
+                    # Jeder Teil-Request eines Batches zählt einzeln (Quota ist bereits mit den Uploads reserviert)
+                    self._throttle_api(len(chunk))
+                    batch.execute()
+                except Exception as e:
+                    # Nicht erstellte Playlists werden später einzeln beim Zuordnen erstellt
+                    print(f"{Fore.YELLOW}⚠️  Playlists konnten nicht vorab erstellt werden: {str(e)}")
+            
+            if created:
+                self._save_playlist_cache()
+                print(f"{Fore.CYAN}📋 {len(created)} neue Playlist(s) erstellt: {', '.join(created)}")
+    
+    def _add_video_to_playlists(self, video_id: str, playlist_ids: Dict[str, str]) -> Dict[str, Exception]:
+        """Fügt ein Video per Batch-Request zu mehreren Playlists hinzu, gibt Fehler je Playlist zurück"""
+        errors = {}
+        pending = list(playlist_ids.items())
+        service = self._get_service()
+        # Ressource einmal erzeugen statt pro Teil-Request (googleapiclient baut sie bei jedem Aufruf neu)
+        playlist_items = service.playlistItems()
+        backoff = self.RETRY_BASE_DELAY
+        
+        for attempt in range(self.PLAYLIST_BATCH_RETRIES + 1):
+            retry = []
+            
+            def on_response(playlist_name, response, exception):
+                if exception is None:
+                    errors.pop(playlist_name, None)
+                    return
+                errors[playlist_name] = exception
+                # Konflikte und Server-Fehler sind oft temporär - erneut versuchen
+                if (isinstance(exception, googleapiclient.errors.HttpError)
+                        and exception.resp.status in self.PLAYLIST_RETRY_STATUS):
+                    retry.append((playlist_name, playlist_ids[playlist_name]))
+            
+            # Maximal 50 Teil-Requests pro Batch (API-Limit)
+            for start in range(0, len(pending), self.PLAYLIST_BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=on_response)
+                for playlist_name, playlist_id in pending[start:start + self.PLAYLIST_BATCH_SIZE]:
+                    batch.add(playlist_items.insert(
+                        part='snippet',
+                        body={
+                            'snippet': {
+                                'playlistId': playlist_id,
+                                'resourceId': {
+                                    'kind': 'youtube#video',
+                                    'videoId': video_id
+                                }
+                            }
+                        }
+                    ), request_id=playlist_name)
+                try:
+                    self._throttle_api(len(pending[start:start + self.PLAYLIST_BATCH_SIZE]))
+                    batch.execute()
+                except Exception as e:
+                    # Ganzer Batch fehlgeschlagen (z.B. Netzwerk) - alle betroffenen Einträge markieren
+                    for playlist_name, playlist_id in pending[start:start + self.PLAYLIST_BATCH_SIZE]:
+                        errors[playlist_name] = e
+                        retry.append((playlist_name, playlist_id))
+            
+            if not retry or attempt == self.PLAYLIST_BATCH_RETRIES:
+                break
             
-        except Exception as e:
-            print(f"{Fore.RED}❌ Fehler beim Hinzufügen zur Playlist: {str(e)}")
+            pending = retry
+            backoff = self._next_backoff(backoff)
+            if self.debug_mode:
+                tqdm.write(f"{Fore.YELLOW}⚠️  {len(pending)} Playlist-Zuordnung(en) fehlgeschlagen, neuer Versuch in {backoff:.1f}s...")
+            time.sleep(backoff)
+        
+        return errors
     
-    def _rename_uploaded_file(self, video: Dict):
+    def _rename_uploaded_file(self, video: VideoInfo):
         """Benennt eine hochgeladene Datei um"""
         try:
-            original_path = Path(video['file_path'])
-            original_name = original_path.name
+            original_path = video['file_path']
+            parent, original_name = os.path.split(original_path)
             
             # Erstelle neuen Namen mit uploaded_ Präfix
-            for prefix in self.VIDEO_PREFIXES:
-                if original_name.startswith(prefix):
-                    new_name = original_name.replace(prefix, self.UPLOADED_PREFIX, 1)
-                    break
+            prefix_match = self._VIDEO_PREFIX_RE.match(original_name)
+            if prefix_match:
+                new_name = self.UPLOADED_PREFIX + original_name[prefix_match.end():]
             else:
                 new_name = f"{self.UPLOADED_PREFIX}{original_name}"
             
-            new_path = original_path.parent / new_name
+            new_path = os.path.join(parent, new_name)
             
-            # Handle Namenskonflikte
-            counter = 1
-            while new_path.exists():
-                name_parts = new_name.rsplit('.', 1)
-                if len(name_parts) == 2:
-                    new_name = f"{name_parts[0]}_{counter}.{name_parts[1]}"
-                else:
-                    new_name = f"{new_name}_{counter}"
-                new_path = original_path.parent / new_name
-                counter += 1
+            # Handle Namenskonflikte (Ordner nur bei einem Konflikt einmal einlesen statt exists() pro Kandidat)
+            if os.path.exists(new_path):
+                existing_names = set(os.listdir(parent))
+                # Name und Endung einmal trennen: name_1.mp4, name_2.mp4, ... (nicht name_1_2.mp4)
+                stem, dot, extension = new_name.rpartition('.')
+                if not dot:
+                    stem, extension = new_name, ''
+                counter = 1
+                while new_name in existing_names:
+                    new_name = f"{stem}_{counter}{dot}{extension}"
+                    counter += 1
+                new_path = os.path.join(parent, new_name)
             
-            # Benenne Datei um
-            original_path.rename(new_path)
+            # Benenne Datei um (os.rename bricht unter Windows ab, statt ein bestehendes Ziel zu überschreiben)
+            os.rename(original_path, new_path)
             
-            print(f"{Fore.CYAN}📝 Datei umbenannt: {original_name} → {new_name}")
+            tqdm.write(f"{Fore.CYAN}📝 Datei umbenannt: {original_name} → {new_name}")
             
             if self.debug_mode:
-                print(f"   Alter Pfad: {original_path}")
-                print(f"   Neuer Pfad: {new_path}")
+                tqdm.write(f"   Alter Pfad: {original_path}")
+                tqdm.write(f"   Neuer Pfad: {new_path}")
                 
         except Exception as e:
-            print(f"{Fore.RED}❌ Fehler beim Umbenennen der Datei: {str(e)}")
+            tqdm.write(f"{Fore.RED}❌ Fehler beim Umbenennen der Datei: {str(e)}")
     
-    def _confirm_upload(self, videos: List[Dict]) -> bool:
+    def _confirm_upload(self, videos: List[VideoInfo]) -> bool:
         """Bestätigung vor dem Upload"""
-        print(f"\n{Fore.YELLOW}⚠️  Sie sind dabei, {len(videos)} Video(s) zu YouTube hochzuladen!")
-        print(f"{Fore.YELLOW}⚠️  Sichtbarkeit: {self.default_visibility.upper()}")
-        print(f"{Fore.YELLOW}⚠️  Nach dem Upload werden die Dateien umbenannt (Präfix 'uploaded_')")
+        self._print_lines([
+            f"\n{Fore.YELLOW}⚠️  Sie sind dabei, {len(videos)} Video(s) zu YouTube hochzuladen!",
+            f"{Fore.YELLOW}⚠️  Sichtbarkeit: {self.default_visibility.upper()}",
+            f"{Fore.YELLOW}⚠️  Nach dem Upload werden die Dateien umbenannt (Präfix 'uploaded_')",
+        ])
         
         response = input(f"\n{Fore.WHITE}Fortfahren? (j/N): ").strip().lower()
         return response in ['j', 'ja', 'y', 'yes']
     
     def _print_upload_summary(self, success_count: int, total_count: int):
         """Druckt Upload-Zusammenfassung"""
-        print(f"\n{Fore.CYAN}{'='*70}")
-        print(f"{Fore.CYAN}📊 UPLOAD-ZUSAMMENFASSUNG")
-        print(f"{Fore.CYAN}{'='*70}")
-        
-        print(f"{Fore.GREEN}✅ Erfolgreich hochgeladen: {success_count}/{total_count}")
-        print(f"{Fore.RED}❌ Fehlgeschlagen: {self.stats['failed_uploads']}")
-        
         success_rate = (success_count / total_count * 100) if total_count > 0 else 0
-        print(f"{Fore.BLUE}📈 Erfolgsrate: {success_rate:.1f}%")
         
-        print(f"\n{Fore.YELLOW}📋 Video-Typen:")
-        print(f"   📹 Merged Videos: {self.stats['merged_videos']}")
-        print(f"   📼 Unmergable Videos: {self.stats['unmergable_videos']}")
-        print(f"   🎤 OnlyMic Videos: {self.stats['onlymic_videos']}")
-        print(f"   🔊 OnlyDesktop Videos: {self.stats['onlydesktop_videos']}")
-        
-        print(f"\n{Fore.CYAN}🎉 Upload-Prozess abgeschlossen!")
+        self._print_lines([
+            f"\n{Fore.CYAN}{'='*70}",
+            f"{Fore.CYAN}📊 UPLOAD-ZUSAMMENFASSUNG",
+            f"{Fore.CYAN}{'='*70}",
+            f"{Fore.GREEN}✅ Erfolgreich hochgeladen: {success_count}/{total_count}",
+            f"{Fore.RED}❌ Fehlgeschlagen: {self.stats['failed_uploads']}",
+            *([f"{Fore.YELLOW}⏸️  Wegen Tages-Quota verschoben: {self.stats['deferred_uploads']}"]
+              if self.stats['deferred_uploads'] else []),
+            f"{Fore.BLUE}📈 Erfolgsrate: {success_rate:.1f}%",
+            f"\n{Fore.YELLOW}📋 Video-Typen:",
+            f"   📹 Merged Videos: {self.stats['merged_videos']}",
+            f"   📼 Unmergable Videos: {self.stats['unmergable_videos']}",
+            f"   🎤 OnlyMic Videos: {self.stats['onlymic_videos']}",
+            f"   🔊 OnlyDesktop Videos: {self.stats['onlydesktop_videos']}",
+            f"\n{Fore.CYAN}🎉 Upload-Prozess abgeschlossen!",
+        ])
 
 
 def main():
@@ -1257,6 +2321,9 @@ Beispiele:
   python uploader.py --preview          # Nur Vorschau, kein Upload
   python uploader.py --debug            # Debug-Modus aktivieren
   python uploader.py --path /pfad/zu/videos  # Alternativer Pfad
+  python uploader.py --concurrency 2    # Höchstens 2 Uploads gleichzeitig
+  python uploader.py --rps 2 --burst 5  # API-Aufrufe auf 2/s begrenzen (Spitzen bis 5)
+  python uploader.py --reauth           # Neu bei Google anmelden (z.B. anderer Kanal)
 
 Konfiguration über .env-Datei:
   RECORDINGS_PATH=/pfad/zu/aufnahmen
@@ -1283,35 +2350,83 @@ Konfiguration über .env-Datei:
         help='Pfad zu den Aufnahmen (überschreibt RECORDINGS_PATH aus .env)'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        metavar='N',
+        help=f'Anzahl gleichzeitiger Uploads (Standard: {YouTubeUploader.MAX_PARALLEL_UPLOADS}, im Debug-Modus immer 1)'
+    )
+    
+    parser.add_argument(
+        '--rps',
+        type=float,
+        metavar='N',
+        help='Maximale API-Aufrufe pro Sekunde (Standard: unbegrenzt)'
+    )
+    
+    parser.add_argument(
+        '--burst',
+        type=int,
+        metavar='N',
+        help='Maximale Anzahl API-Aufrufe auf einmal bei aktivem --rps (Standard: --rps, mindestens 1)'
+    )
+    
+    parser.add_argument(
+        '--reauth',
+        action='store_true',
+        help='Gespeichertes OAuth-Token verwerfen und neu anmelden'
+    )
+    
     args = parser.parse_args()
     
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error('--concurrency muss mindestens 1 sein')
+    if args.rps is not None and args.rps <= 0:
+        parser.error('--rps muss größer als 0 sein')
+    if args.burst is not None and args.burst < 1:
+        parser.error('--burst muss mindestens 1 sein')
+    
     # Validiere Pfad
     recordings_path = args.path or os.getenv('RECORDINGS_PATH')
     
     if not recordings_path:
-        print(f"{Fore.RED}❌ Fehler: Kein Aufnahmen-Pfad angegeben!")
-        print(f"{Fore.YELLOW}💡 Setzen Sie RECORDINGS_PATH in der .env-Datei oder verwenden Sie --path")
-        print(f"{Fore.YELLOW}   Beispiel: RECORDINGS_PATH=/home/carst/n_drive/AUFNAHMEN")
+        YouTubeUploader._print_lines([
+            f"{Fore.RED}❌ Fehler: Kein Aufnahmen-Pfad angegeben!",
+            f"{Fore.YELLOW}💡 Setzen Sie RECORDINGS_PATH in der .env-Datei oder verwenden Sie --path",
+            f"{Fore.YELLOW}   Beispiel: RECORDINGS_PATH=/home/carst/n_drive/AUFNAHMEN",
+        ])
         sys.exit(1)
     
     if not os.path.exists(recordings_path):
-        print(f"{Fore.RED}❌ Fehler: Aufnahmen-Pfad nicht gefunden: {recordings_path}")
-        print(f"{Fore.YELLOW}💡 Stellen Sie sicher, dass der SMB-Drive gemountet ist!")
+        YouTubeUploader._print_lines([
+            f"{Fore.RED}❌ Fehler: Aufnahmen-Pfad nicht gefunden: {recordings_path}",
+            f"{Fore.YELLOW}💡 Stellen Sie sicher, dass der SMB-Drive gemountet ist!",
+        ])
         sys.exit(1)
     
     # Erstelle Uploader-Instanz
     uploader = YouTubeUploader(
         recordings_path=recordings_path,
-        debug_mode=args.debug or os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+        debug_mode=args.debug or os.getenv('DEBUG_MODE', 'false').lower() == 'true',
+        max_concurrent_uploads=args.concurrency,
+        requests_per_second=args.rps,
+        burst=args.burst
     )
     
     try:
+        # Ohne Token und credentials.json kann die Anmeldung nur scheitern - vor dem (auf SMB langsamen) Scan abbrechen
+        if not uploader.can_authenticate(force_reauth=args.reauth):
+            uploader.print_credentials_help()
+            sys.exit(1)
+        
         # Suche Videos
         videos = uploader.find_videos()
         
         if not videos:
-            print(f"{Fore.YELLOW}📭 Keine Videos zum Upload gefunden.")
-            print(f"{Fore.YELLOW}💡 Überprüfen Sie, ob Videos mit den Präfixen 'merged_' oder 'unmergable_' vorhanden sind.")
+            YouTubeUploader._print_lines([
+                f"{Fore.YELLOW}📭 Keine Videos zum Upload gefunden.",
+                f"{Fore.YELLOW}💡 Überprüfen Sie, ob Videos mit den Präfixen 'merged_' oder 'unmergable_' vorhanden sind.",
+            ])
             sys.exit(0)
         
         # Preview-Modus
@@ -1320,24 +2435,26 @@ Konfiguration über .env-Datei:
             
             # Teste auch die YouTube-Authentifizierung im Preview-Modus
             print(f"\n{Fore.CYAN}🔑 Teste YouTube-Authentifizierung...")
-            if uploader.authenticate_youtube():
+            if uploader.authenticate_youtube(force_reauth=args.reauth):
                 print(f"{Fore.GREEN}✅ YouTube-Authentifizierung erfolgreich getestet!")
             else:
-                print(f"{Fore.RED}❌ YouTube-Authentifizierung fehlgeschlagen!")
-                print(f"{Fore.YELLOW}💡 Überprüfen Sie Ihre credentials.json Datei.")
+                YouTubeUploader._print_lines([
+                    f"{Fore.RED}❌ YouTube-Authentifizierung fehlgeschlagen!",
+                    f"{Fore.YELLOW}💡 Überprüfen Sie Ihre credentials.json Datei.",
+                ])
                 sys.exit(1)
             
             print(f"\n{Fore.CYAN}👁️  Preview-Modus: Kein Upload durchgeführt")
             sys.exit(0)
         
-        # Zeige Vorschau
-        uploader.preview_videos(videos)
-        
-        # Authentifizierung
-        if not uploader.authenticate_youtube():
+        # Authentifizierung zuerst, damit ein Fehler nicht erst nach der Vorschau auffällt
+        if not uploader.authenticate_youtube(force_reauth=args.reauth):
             print(f"{Fore.RED}❌ YouTube-Authentifizierung fehlgeschlagen!")
             sys.exit(1)
         
+        # Zeige Vorschau
+        uploader.preview_videos(videos)
+        
         # Upload
         success = uploader.upload_videos(videos)
         
@@ -1352,10 +2469,11 @@ Konfiguration über .env-Datei:
         print(f"\n{Fore.YELLOW}⏹️  Upload durch Benutzer abgebrochen.")
         sys.exit(0)
     except Exception as e:
-        print(f"\n{Fore.RED}❌ Unerwarteter Fehler: {str(e)}")
+        lines = [f"\n{Fore.RED}❌ Unerwarteter Fehler: {str(e)}"]
         if args.debug:
             import traceback
-            print(f"{Fore.RED}{traceback.format_exc()}")
+            lines.append(f"{Fore.RED}{traceback.format_exc()}")
+        YouTubeUploader._print_lines(lines)
         sys.exit(1)
 
 